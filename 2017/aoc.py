@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+''' Helpers shared by the 2017 solutions, like the ones of 2021/aoc.py.
+
+    Every day defines part1(specifier=None) and part2(specifier=None),
+    returning the answers, and runs them with aoc.run(part1, part2). The
+    input of day NN is input/inputNN.txt, or input/inputNN.<spec>.txt
+    when a specifier is passed or set in AOC_INPUTSPEC. This is what lets
+    the runner and the benchmarks of 2021/aoc.py handle the 2017 days.
+'''
+import hashlib
+import importlib.util
+import logging
+import mmap
+import os
+import sys
+from pathlib import Path
+
+INPUT_DIR = Path(__file__).parent / 'input'
+CACHE_DIR = Path(__file__).parent / 'cache'
+# the cache entries are handled by the helpers of 2021
+AOC2021 = Path(__file__).parent.parent / '2021' / 'aoc.py'
+
+
+# ------------------------------------------------
+# Input readers.
+# ------------------------------------------------
+def input_file(day, specifier=None):
+    specifier = specifier if specifier is not None else os.environ.get('AOC_INPUTSPEC', None)
+    if specifier is not None:
+        return INPUT_DIR / ('input%02d.%s.txt' % (day, specifier))
+    else:
+        return INPUT_DIR / ('input%02d.txt' % day)
+
+
+def input_lines(day, specifier=None):
+    ''' All the lines of the input, read in one go. '''
+    return input_file(day, specifier).read_text().splitlines()
+
+
+def input_buffer(day, specifier=None):
+    ''' Memory-map the input and return a read-only memoryview over its
+        bytes. Slices of the view are not copies, and the mapping is
+        released with the last view using it.
+    '''
+    with input_file(day, specifier).open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses to map empty files
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+# ------------------------------------------------
+# Parsed input cache.
+# ------------------------------------------------
+def aoc2021():
+    ''' The aoc module of 2021, imported from its file as aoc2021: the
+        cache entries are stored, loaded and evicted by its helpers.
+    '''
+    if 'aoc2021' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('aoc2021', AOC2021)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['aoc2021'] = module
+        spec.loader.exec_module(module)
+    return sys.modules['aoc2021']
+
+
+def code_version(*objs):
+    ''' The source of the functions and classes a cached result depends on. '''
+    return b''.join(aoc2021().code_version(obj) for obj in objs)
+
+
+def cached_parse(day, specifier, parser, version=None):
+    ''' Return parser(specifier), reusing a result cached in cache/ if
+        available, like cached_parse() of 2021/aoc.py. Entries are keyed
+        by the SHA-256 of the input, and the parser's name and version
+        (its source by default: pass code_version(parser, ...) if the
+        result also depends on other code), and evicted least recently
+        used first beyond AOC_CACHE_MAXBYTES. Setting
+        AOC_CACHE_MAXBYTES=0 disables caching.
+    '''
+    shared = aoc2021()
+    max_bytes = shared.cache_maxbytes()
+    if max_bytes <= 0:
+        return parser(specifier)
+
+    version = version if version is not None else code_version(parser)
+    key = hashlib.sha256(input_buffer(day, specifier))
+    key.update(('%s.%s' % (parser.__module__, parser.__qualname__)).encode())
+    key.update(version if isinstance(version, bytes) else str(version).encode())
+    cache_base = CACHE_DIR / ('day%02d-%s' % (day, key.hexdigest()))
+
+    found, parsed = shared.cache_load(cache_base)
+    if found:
+        return parsed
+    parsed = parser(specifier)
+    shared.cache_store(cache_base, parsed)
+    shared.cache_evict(CACHE_DIR, max_bytes)
+    return parsed
+
+
+# ------------------------------------------------
+# Running.
+# ------------------------------------------------
+def parallel_imap(func, iterable):
+    ''' pool.imap_unordered(func, iterable) over a process pool, or a
+        plain map in a worker process of the runner, which is daemonic
+        and can't start processes of its own.
+    '''
+    import multiprocessing
+
+    if multiprocessing.current_process().daemon:
+        yield from map(func, iterable)
+        return
+    with multiprocessing.Pool() as pool:
+        yield from pool.imap_unordered(func, iterable)
+
+
+def debug_enabled():
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
+def logging_setup(loglevel_default='WARNING'):
+    loglevel = os.environ.get('AOC_LOGLEVEL', loglevel_default).upper()
+    logging.basicConfig(level=loglevel)
+
+
+def run(*parts, specifier=None):
+    ''' Entry point for the __main__ block of a day: print the answer of each part. '''
+    logging_setup()
+    for part in parts:
+        print(part(specifier))
+
+# vim:sts=4:sw=4:et:
@@ -1,18 +1,86 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
+import functools
+import numpy
+import aoc
 
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
+# inputs larger than this are processed in chunks, straight from the
+# memory mapped file
+MMAP_THRESHOLD = 2**26
+CHUNK_SIZE = 2**22
 
-with open(INPUT) as f:
-    s = ''.join(map(str.strip, f.readlines()))
-l = len(s)
+def digits(data):
+    ''' The digits of the input as a uint8 array, skipping line breaks. '''
+    a = numpy.frombuffer(data, dtype=numpy.uint8)
+    return a[(a >= ord('0')) & (a <= ord('9'))] - ord('0')
 
-total1 = sum([int(c) if c == s[i+1] else 0 for i, c in enumerate(s[:-1])])
-total1 += int(s[-1]) if s[0] == s[-1] else 0
-total2 = sum([int(c) if c == s[(i+int(l/2))%l] else 0 for i, c in enumerate(s[:-1])])
+def captcha(d):
+    ''' Sum the digits matching the next one (part 1), and the ones
+        matching the digit halfway around the circular list (part 2).
+    '''
+    total1 = d[d == numpy.roll(d, -1)].sum(dtype=numpy.int64)
+    total2 = d[d == numpy.roll(d, -(len(d)//2))].sum(dtype=numpy.int64)
+    return int(total1), int(total2)
 
-print(total1, total2)
+def digit_chunks(buf, skip=0):
+    ''' Yield the digits of the mapped input in arrays of CHUNK_SIZE
+        digits (the last one may be shorter), after skipping the first
+        skip digits. Chunks of both halves of the input line up.
+    '''
+    pending = numpy.empty(0, dtype=numpy.uint8)
+    for start in range(0, len(buf), CHUNK_SIZE):
+        d = digits(buf[start:start+CHUNK_SIZE])
+        if skip > 0:
+            skipped = min(skip, len(d))
+            d, skip = d[skipped:], skip - skipped
+        pending = numpy.concatenate([pending, d])
+        while len(pending) >= CHUNK_SIZE:
+            yield pending[:CHUNK_SIZE]
+            pending = pending[CHUNK_SIZE:]
+    if len(pending) > 0:
+        yield pending
+
+def captcha_mapped(buf):
+    ''' Same as captcha(), for inputs too large to fit in memory.
+        Part 1 carries the last digit of each chunk over to the next
+        one (and the first digit of the input to the end). Part 2 pairs
+        digit i with digit i+n//2, walking the input side by side with
+        itself shifted by n//2, then pairs the last n//2 digits with the
+        first ones, which wraps around. Unlike doubling the matches of
+        the first half, this also holds for an odd number of digits.
+    '''
+    total1, n = 0, 0
+    first, carry = None, numpy.empty(0, dtype=numpy.uint8)
+    for chunk in digit_chunks(buf):
+        first = chunk[0] if first is None else first
+        d = numpy.concatenate([carry, chunk])
+        total1 += int(d[:-1][d[:-1] == d[1:]].sum(dtype=numpy.int64))
+        carry, n = d[-1:], n + len(chunk)
+    if n > 0 and carry[0] == first:
+        total1 += int(first)
+
+    total2 = 0
+    for skip_a, skip_b in ((0, n//2), (n - n//2, 0)):
+        for a, b in zip(digit_chunks(buf, skip_a), digit_chunks(buf, skip_b)):
+            m = min(len(a), len(b))
+            a, b = a[:m], b[:m]
+            total2 += int(a[a == b].sum(dtype=numpy.int64))
+    return total1, total2
+
+@functools.cache
+def captcha_sums(specifier):
+    buf = aoc.input_buffer(1, specifier)
+    if len(buf) < MMAP_THRESHOLD:
+        return captcha(digits(buf))
+    else:
+        return captcha_mapped(buf)
+
+def part1(specifier=None):
+    return captcha_sums(specifier)[0]
+
+def part2(specifier=None):
+    return captcha_sums(specifier)[1]
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
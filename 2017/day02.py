@@ -1,25 +1,72 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
+import os
+import functools
+import aoc
 
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
+# spreadsheets larger than this are checksummed by a process pool
+POOL_THRESHOLD = 2**20
+POOL_CHUNK_ROWS = 1000
 
-checksum1 = 0
-checksum2 = 0
+def divisible_sum(cells):
+    ''' Sum c1/c2 over the pairs of cells where c2 evenly divides c1.
+        With the row sorted, each cell is only tested as a divisor of
+        the larger cells: either by looking up its multiples in the set
+        of values, or by testing the larger cells directly, whichever
+        takes fewer steps.
+    '''
+    cells = sorted(cells)
+    values = set(cells)
+    largest = cells[-1]
+    total = 0
+    for i, c2 in enumerate(cells):
+        if c2 == 0:
+            continue
+        if largest // c2 < len(cells) - i:
+            total += sum(m // c2 for m in range(2*c2, largest+1, c2) if m in values)
+        else:
+            total += sum(cells[j] // c2 for j in range(i+1, len(cells)) if cells[j] % c2 == 0)
+    return total
 
-with open(INPUT) as f:
-    for l in f:
+def row_checksums(lines):
+    checksum1 = 0
+    checksum2 = 0
+    for l in lines:
         cells = list(map(int, l.split()))
+        if not cells:
+            continue
 
         checksum1 += max(cells) - min(cells)
 
         assert len(cells) == len(set(cells)), 'Line with duplicate in input.'
-        for c1 in cells:
-            for c2 in cells:
-                if (c1 != c2 and c1 % c2 == 0):
-                    checksum2 += int(c1/c2)
+        checksum2 += divisible_sum(cells)
+    return checksum1, checksum2
+
+def chunks(f, nrows):
+    chunk = []
+    for l in f:
+        chunk.append(l)
+        if len(chunk) == nrows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+@functools.cache
+def checksums(specifier):
+    with aoc.input_file(2, specifier).open() as f:
+        if os.fstat(f.fileno()).st_size < POOL_THRESHOLD:
+            return row_checksums(f)
+        # merge the partial checksums of chunks of rows
+        partial = list(aoc.parallel_imap(row_checksums, chunks(f, POOL_CHUNK_ROWS)))
+    return sum(c1 for c1, _ in partial), sum(c2 for _, c2 in partial)
+
+def part1(specifier=None):
+    return checksums(specifier)[0]
+
+def part2(specifier=None):
+    return checksums(specifier)[1]
 
-print(checksum1, checksum2)
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
@@ -1,90 +1,80 @@
 #!/usr/bin/env python3
-import sys
 import math
 import itertools
-import numpy
-
-DEBUG = False
-DEBUG_WALK = False
-
-n = int(sys.argv[1]) if len(sys.argv) > 1 else 325489
-
-# the size of the spiral side required to include the input - size must be odd number
-size = int(math.sqrt(n))
-size += 1 if size**2 < n else 0
-size += 1 if size % 2 == 0 else 0
-
-# the last cells in the two external spirals - size must be odd number for both
-last = size**2
-last_prev = (size-2)**2
-
-# minimum/maximum distances from the center
-min_dist = int(size/2)
-max_dist = 2*int(size/2)
-
-# in the external ring, distances take values between max_dist to min_dist
-# the following block of distances is cycled over
-# e.g. for size=5, this would be [4, 3, 2, 3]
-distblock = itertools.chain(range(max_dist, min_dist-1, -1), range(min_dist+1, max_dist, 1))
-
-# debug print - iterator has to be copied, otherwise it is consumed
-if DEBUG:
-    print('n=%d size=%d last=%d last_prev=%d min_dist=%d max_dist=%d distblock=%s' % (n, size, last, last_prev, min_dist, max_dist, str(list(itertools.tee(distblock)))))
-
-# part 1 - smart approach
-# the input is contained on the external ring of the spiral
-# run through the items and cycle the distblock until we hit n
-for c, dist in zip(range(last, last_prev, -1), itertools.cycle(distblock)):
-    if (c == n):
-        print(c, dist)
-        break
-
-# part 2 - brute force approach
-# walk the spirals and keep updating the sums as we go
-sums = numpy.zeros([size, size], int)
-x, y = int(size/2), int(size/2)
-sums[x][y] = 1
-i = 1
-for ring_size in range(3, size+1, 2):
-    # calculate steps for current spiral
-    steps = [( 0,  1)] +\
-            [(-1,  0)] * (ring_size-2) +\
-            [( 0, -1)] * (ring_size-1) +\
-            [( 1,  0)] * (ring_size-1) +\
-            [( 0,  1)] * (ring_size-2) +\
-            [( 0,  1)]
-    if DEBUG:
-        print('steps for ring_size=%d: %s' % (ring_size, steps))
-
-    # walk the steps on the current ring and update sums
-    for st in steps:
-        x += st[0]
-        y += st[1]
-        i += 1
-
-        # only check we're walking the array properly
-        if DEBUG_WALK:
-            sums[x][y] = i
-            print(x,y)
-            print(sums)
-            continue
-
-        # sum the items in the neighborhood of the current cell
-        in_range = lambda n: n[0]>=0 and n[0]<size and n[1]>=0 and n[1]<size
-        neighbors = itertools.product((-1, 0, 1), (-1, 0, 1))
-        neighbors_coords = filter(in_range, map(lambda n: (x+n[0], y+n[1]), neighbors))
-        sums[x][y] = sum([sums[nx][ny] for nx, ny in neighbors_coords])
-
-        if DEBUG:
-            print(sums)
-            print('')
-
-        # print the desired value
-        if sums[x][y] > n:
-            print(n, sums[x][y])
-            break
-
-    if sums[x][y] > n:
-        break
+import logging
+import aoc
+
+# Cells are numbered along the spiral, 1 at the center (0, 0), 2 on its
+# right at (1, 0), 3 above that at (1, 1), etc. Ring k is the square of
+# side 2k+1 around the center: it holds the cells (2k-1)^2+1 to (2k+1)^2,
+# starting just above its bottom-right corner and going up, left, down
+# and right along its four sides of 2k cells each.
+
+def ring_of(i):
+    return (math.isqrt(i-1)+1) // 2
+
+def coords(i):
+    ''' The coordinates of cell i. '''
+    k = ring_of(i)
+    if k == 0:
+        return (0, 0)
+    side, t = divmod(i - (2*k-1)**2 - 1, 2*k)
+    return [(k, -k+1+t), (k-1-t, k), (-k, k-1-t), (-k+1+t, -k)][side]
+
+def index(x, y):
+    ''' The number of the cell at (x, y), the inverse of coords(). '''
+    k = max(abs(x), abs(y))
+    if k == 0:
+        return 1
+    first = (2*k-1)**2 + 1
+    if x == k and y > -k:
+        return first + y+k-1
+    elif y == k:
+        return first + 2*k + k-1-x
+    elif x == -k:
+        return first + 4*k + k-1-y
+    else:
+        return first + 6*k + x+k-1
+
+def spiral_sums():
+    ''' Yield the sums of the neighbours already written, cell by cell.
+        The neighbours of a cell are on its own ring or the previous
+        one, so only these two rings of sums are kept.
+    '''
+    prev, prev_first = [1], 1
+    yield 1
+    for k in itertools.count(1):
+        ring, first = [], (2*k-1)**2 + 1
+        for i in range(first, (2*k+1)**2 + 1):
+            x, y = coords(i)
+            s = 0
+            for dx, dy in ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)):
+                j = index(x+dx, y+dy)
+                if j < first:
+                    if j >= prev_first:
+                        s += prev[j - prev_first]
+                elif j < i:
+                    s += ring[j - first]
+            ring.append(s)
+            yield s
+        prev, prev_first = ring, first
+
+def puzzle_input(specifier):
+    return int(aoc.input_lines(3, specifier)[0])
+
+def part1(specifier=None):
+    ''' The distance is the sum of the absolute coordinates. '''
+    n = puzzle_input(specifier)
+    x, y = coords(n)
+    logging.debug('n=%d ring=%d coords=%s' % (n, ring_of(n), (x, y)))
+    return abs(x) + abs(y)
+
+def part2(specifier=None):
+    ''' The first sum larger than the input. '''
+    n = puzzle_input(specifier)
+    return next(s for s in spiral_sums() if s > n)
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
@@ -1,25 +1,92 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
+import functools
+import numpy
+import aoc
 
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
+# the input is validated in blocks of whole lines, by a process pool
+# if there is more than one block
+BLOCK_SIZE = 2**20
+WHITESPACE = numpy.frombuffer(b' \t\n\v\f\r', dtype=numpy.uint8)
 
-nvalid1 = 0
-nvalid2 = 0
+# Instead of splitting lines into words, and sorting the letters of
+# every word, the whole block is handled as an array of bytes. Every
+# word gets a row of its bytes (part 1) and a row of its 26 letter
+# counts (part 2), the anagram signature. A line is invalid if it has
+# fewer unique rows than words.
 
-with open(INPUT) as f:
-    for l in f:
-        words1 = l.split()
-        words1_uniq = set(words1)
-        if len(words1) == len(words1_uniq):
-            nvalid1 += 1
+def lines_with_duplicates(word_line, rows, nlines):
+    ''' Count the lines with duplicate rows among their words. '''
+    # prefix the rows with their line, so that unique rows are per line
+    keys = numpy.hstack([word_line.astype(numpy.uint32).view(numpy.uint8).reshape(-1, 4), rows])
+    keys = keys.view(numpy.dtype((numpy.void, keys.shape[1]))).ravel()
+    unique_line = word_line[numpy.unique(keys, return_index=True)[1]]
+    nwords = numpy.bincount(word_line, minlength=nlines)
+    nunique = numpy.bincount(unique_line, minlength=nlines)
+    return numpy.count_nonzero(nwords != nunique)
 
-        words2 = list(map(lambda s: ''.join(s), map(sorted, l.split())))
-        words2_uniq = set(words2)
-        if len(words2) == len(words2_uniq):
-            nvalid2 += 1
+def block_counts(block):
+    ''' Count the valid passphrases in a block of whole lines, for both
+        parts. Empty lines are valid, like in the line by line version.
+    '''
+    a = numpy.frombuffer(block, dtype=numpy.uint8)
+    newline = a == ord('\n')
+    nlines = numpy.count_nonzero(newline) + (1 if len(a) > 0 and not newline[-1] else 0)
 
-print(nvalid1, nvalid2)
+    in_word = ~numpy.isin(a, WHITESPACE)
+    word_start = in_word.copy()
+    word_start[1:] &= ~in_word[:-1]
+    starts = numpy.flatnonzero(word_start)
+    if len(starts) == 0:
+        return nlines, nlines
+    word_line = (numpy.cumsum(newline) - newline)[starts]
+
+    # word and offset in the word of every byte of the words
+    pos = numpy.flatnonzero(in_word)
+    word = numpy.cumsum(word_start)[pos] - 1
+    offset = pos - starts[word]
+    assert offset.max() < 255, 'Word too long in input.'
+    chars = numpy.zeros((len(starts), offset.max()+1), dtype=numpy.uint8)
+    chars[word, offset] = a[pos]
+
+    letters = a[pos] - ord('a')
+    assert letters.max() < 26, 'Word with other characters than lowercase letters in input.'
+    counts = numpy.bincount(word * 26 + letters, minlength=len(starts) * 26)
+    signatures = counts.astype(numpy.uint8).reshape(-1, 26)
+
+    return (int(nlines - lines_with_duplicates(word_line, chars, nlines)),
+            int(nlines - lines_with_duplicates(word_line, signatures, nlines)))
+
+def blocks(buf):
+    ''' Cut the mapped input in blocks of about BLOCK_SIZE bytes, after a line break. '''
+    start = 0
+    while start < len(buf):
+        end = start
+        cut = 0
+        while cut == 0 and end < len(buf):
+            # grow the block until it holds a line break
+            end = min(end + BLOCK_SIZE, len(buf))
+            data = bytes(buf[start:end])
+            cut = data.rfind(b'\n') + 1
+        if end < len(buf):
+            data, end = data[:cut], start + cut
+        yield data
+        start = end
+
+@functools.cache
+def valid_counts(specifier):
+    buf = aoc.input_buffer(4, specifier)
+    if len(buf) <= BLOCK_SIZE:
+        return block_counts(buf)
+    counts = list(aoc.parallel_imap(block_counts, blocks(buf)))
+    return sum(n1 for n1, _ in counts), sum(n2 for _, n2 in counts)
+
+def part1(specifier=None):
+    return valid_counts(specifier)[0]
+
+def part2(specifier=None):
+    return valid_counts(specifier)[1]
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
@@ -1,31 +1,122 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
-
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
-
-# part 1
-i = 0
-steps = 0
-with open(INPUT) as f:
-    j = [int(l) for l in f]
-while i < len(j) and i >= 0:
-    j[i] += 1
-    i += j[i]-1
-    steps += 1
-print(steps)
-
-# part 2
-i = 0
-steps = 0
-with open(INPUT) as f:
-    j = [int(l) for l in f]
-while i < len(j) and i >= 0:
-    d = 1 if j[i] < 3 else -1
-    j[i] += d
-    i += j[i]-d
-    steps += 1
-print(steps)
+import logging
+from array import array
+import aoc
+
+# In part 2 an offset of 3 becomes 2 when jumped from, and an offset of
+# 2 becomes 3, so once an offset is 2 or 3 it stays so forever. The
+# jumps settle from the start of the maze: its prefix soon consists of
+# 2s and 3s only, and jumps in it only ever go forward. The prefix is
+# frozen in blocks of BLOCK bits (3 is a 1 bit), and crossing a block
+# is looked up by its state and entry offset, instead of being stepped
+# through jump by jump. With blocks of 8 bits the lookup table holds at
+# most 2048 crossings, and larger blocks are slower for the real input.
+BLOCK = 8
+
+class JumpMaze:
+    ''' Jump maze interpreter over an array of offsets. Counts the steps
+        taken, and how many of them were taken across frozen blocks.
+    '''
+    def __init__(self, offsets):
+        self.j = array('i', offsets)
+        self.steps = 0
+        self.block_steps = 0
+        self.block_crossings = 0
+        self.blocks = [] # states of the frozen blocks at the start of the maze
+        self.crossings = {} # (state, entry offset) -> (new state, exit offset, steps)
+
+    def stats(self):
+        return {
+            'steps': self.steps,
+            'block_steps': self.block_steps,
+            'block_crossings': self.block_crossings,
+            'frozen': len(self.blocks) * BLOCK,
+            'crossings_known': len(self.crossings),
+        }
+
+    def run1(self):
+        ''' Part 1: every offset is incremented after its jump. '''
+        j, n = self.j, len(self.j)
+        i = steps = 0
+        while 0 <= i < n:
+            v = j[i]
+            j[i] = v + 1
+            i += v
+            steps += 1
+        self.steps += steps
+        return steps
+
+    def cross(self, state, o):
+        ''' Jump across a frozen block entered at offset o. '''
+        key = state * BLOCK + o
+        if key not in self.crossings:
+            steps = 0
+            while o < BLOCK:
+                bit = 1 << o
+                o += 3 if state & bit else 2
+                state ^= bit
+                steps += 1
+            self.crossings[key] = (state, o - BLOCK, steps)
+        return self.crossings[key]
+
+    def freeze(self):
+        ''' Freeze the blocks following the frozen prefix that only hold 2s and 3s. '''
+        j, n = self.j, len(self.j)
+        start = len(self.blocks) * BLOCK
+        while start + BLOCK <= n and all(v == 2 or v == 3 for v in j[start:start+BLOCK]):
+            self.blocks.append(sum(1 << k for k, v in enumerate(j[start:start+BLOCK]) if v == 3))
+            start += BLOCK
+
+    def run2(self):
+        ''' Part 2: offsets of 3 or more are decremented after their jump,
+            the others incremented.
+        '''
+        j, n, blocks, crossings = self.j, len(self.j), self.blocks, self.crossings
+        i = steps = 0
+        self.freeze()
+        while 0 <= i < n:
+            frozen = len(blocks) * BLOCK
+            if i < frozen:
+                b, o = divmod(i, BLOCK)
+                nblocks, block_steps = len(blocks), 0
+                self.block_crossings += nblocks - b
+                while b < nblocks:
+                    crossing = crossings.get(blocks[b] * BLOCK + o)
+                    if crossing is None:
+                        crossing = self.cross(blocks[b], o)
+                    blocks[b], o, s = crossing
+                    block_steps += s
+                    b += 1
+                self.block_steps += block_steps
+                steps += block_steps
+                i = frozen + o
+                continue
+            v = j[i]
+            j[i] = v - 1 if v >= 3 else v + 1
+            if i < frozen + BLOCK and (v == 2 or v == 3):
+                self.freeze()
+            i += v
+            steps += 1
+        # write the frozen blocks back, the array is the state of the maze
+        for b, state in enumerate(blocks):
+            for k in range(BLOCK):
+                j[b*BLOCK + k] = 3 if state & (1 << k) else 2
+        self.steps += steps
+        return steps
+
+def parse_input(specifier):
+    return [int(l) for l in aoc.input_lines(5, specifier) if l.strip()]
+
+def part1(specifier=None):
+    return JumpMaze(parse_input(specifier)).run1()
+
+def part2(specifier=None):
+    maze = JumpMaze(parse_input(specifier))
+    steps = maze.run2()
+    logging.debug('%s' % maze.stats())
+    return steps
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
@@ -1,32 +1,90 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
+import os
+import functools
+import aoc
 
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
+# cycle detector: brent, floyd or dict
+DETECTOR = os.environ.get('AOC_DETECTOR', 'brent')
 
-# part 1
-i = 0
-steps = 0
-with open(INPUT) as f:
-    b = [int(i) for i in f.read().split()]
+def redistribute(b):
+    ''' Redistribute the blocks of the largest bank (the first one on
+        ties): every bank gets maxv // len(b) of them, and the remaining
+        maxv % len(b) banks following it one more.
+    '''
+    idx, maxv = max(enumerate(b), key=lambda t: t[1])
+    q, r = divmod(maxv, len(b))
+    b = [v + q for v in b]
+    b[idx] = q
+    for i in range(idx+1, idx+1+r):
+        b[i % len(b)] += 1
+    return tuple(b)
 
+# The cycle detectors return mu, the index of the first configuration
+# of the loop, and lam, the length of the loop. The first configuration
+# seen twice is then configuration mu + lam.
 
-b2s = lambda a: ' '.join(['%04d' % i for i in a])
-seen = {}
-n = 0
-while True:
-    s = b2s(b)
-    if s in seen: break
-    seen[s] = n
-    n += 1
+def brent(f, x0):
+    ''' Brent's algorithm, in O(1) memory. '''
+    power = lam = 1
+    tortoise, hare = x0, f(x0)
+    while tortoise != hare:
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = f(hare)
+        lam += 1
+    tortoise = hare = x0
+    for _ in range(lam):
+        hare = f(hare)
+    mu = 0
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(hare)
+        mu += 1
+    return mu, lam
 
-    idx, maxv = max(enumerate(b), key=lambda t: t[1])
-    b[idx] = 0
-    for i in range(maxv):
-        idx = (idx+1) % len(b)
-        b[idx] += 1
+def floyd(f, x0):
+    ''' Floyd's tortoise and hare, in O(1) memory. '''
+    tortoise, hare = f(x0), f(f(x0))
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(f(hare))
+    mu, tortoise = 0, x0
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(hare)
+        mu += 1
+    lam, hare = 1, f(tortoise)
+    while tortoise != hare:
+        hare = f(hare)
+        lam += 1
+    return mu, lam
+
+def dict_detector(f, x0):
+    ''' Remember the index of every configuration, in O(mu + lam) memory
+        but with a single pass.
+    '''
+    seen = {}
+    x, n = x0, 0
+    while x not in seen:
+        seen[x] = n
+        x, n = f(x), n + 1
+    return seen[x], n - seen[x]
+
+DETECTORS = {'brent': brent, 'floyd': floyd, 'dict': dict_detector}
+
+@functools.cache
+def find_loop(specifier, detector=DETECTOR):
+    b = tuple(int(i) for i in aoc.input_file(6, specifier).read_text().split())
+    return DETECTORS[detector](redistribute, b)
+
+def part1(specifier=None):
+    mu, lam = find_loop(specifier)
+    return mu + lam
+
+def part2(specifier=None):
+    mu, lam = find_loop(specifier)
+    return lam
 
-print(n, n-seen[s])
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
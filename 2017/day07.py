@@ -1,96 +1,122 @@
 #!/usr/bin/env python3
-import sys
-from pathlib import Path as _P
 import re
+import logging
+import functools
+import aoc
 
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
+# node table - programs are numbered in order of first appearance
+class Tower:
+    line_re = re.compile(r'(?P<name>[a-z]+)\s+\((?P<weight>[0-9]+)\)\s*(?:->\s*(?P<children>.*))?')
 
-# wrapper class
-class Node:
-    def __init__(self, line):
-        node, sep, children = l.partition('->')
-        node_match = re.match(r'(?P<name>[a-z]+)\s+\((?P<weight>[0-9]+)\)\s*', node)
-        if not node_match:
-            raise Exception('Bad line: %s\n' % line)
-        self.name = node_match.group('name')
-        self.weight = int(node_match.group('weight'))
-        self.children = set() if not children else set([c.strip() for c in children.split(',')])
-        self.tweight = None
+    def __init__(self):
+        self.index = {}
+        self.names = []
+        self.weights = []
+        self.children = []
+        self.parents = []
 
-    def __str__(self):
-        return '%s (%d) -> %s' % (self.name, self.weight, self.children)
+    def node(self, name):
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self.weights.append(None)
+            self.children.append([])
+            self.parents.append(None)
+        return self.index[name]
 
-    def __repr__(self):
-        return self.__str__()
+    def add(self, line):
+        m = Tower.line_re.match(line)
+        if not m:
+            raise Exception('Bad line: %s\n' % line)
+        p = self.node(m.group('name'))
+        self.weights[p] = int(m.group('weight'))
+        if m.group('children'):
+            for name in m.group('children').split(','):
+                c = self.node(name.strip())
+                self.children[p].append(c)
+                self.parents[c] = p
 
-    def get_tree_weight(self, progs):
-        if self.tweight is None:
-            w = self.weight
-            for c in self.children:
-                w += progs[c].get_tree_weight(progs)
-            self.tweight = w
-        return self.tweight
+    def root(self):
+        roots = [p for p, parent in enumerate(self.parents) if parent is None]
+        assert len(roots) == 1, 'Expected a single root, found %d.' % len(roots)
+        return roots[0]
 
-    def get_unbalanced(self, progs):
-        if not self.children: return None
+    def tree_weights(self, root):
+        ''' Weights of all subtrees, summed in post-order without recursion:
+            in reverse pre-order, every node comes after its children.
+        '''
+        preorder = []
+        stack = [root]
+        while stack:
+            p = stack.pop()
+            preorder.append(p)
+            stack.extend(self.children[p])
+        tweights = list(self.weights)
+        for p in reversed(preorder):
+            if p != root:
+                tweights[self.parents[p]] += tweights[p]
+        return tweights
 
+    def unbalanced(self, p, tweights):
+        ''' Return the unbalanced child of p and the adjustment of its
+            weight that balances it, or None if the children of p are
+            balanced.
+        '''
         # get weights and count them
         weights = {}
-        for c in self.children:
-            w = progs[c].get_tree_weight(progs)
-            if not w in weights:
-                weights[w] = []
-            weights[w].append(c)
+        for c in self.children[p]:
+            weights.setdefault(tweights[c], []).append(c)
 
         # expect at most two different weights
-        assert len(weights) < 3, 'More than one children unbalanced for %s.' % self.name
+        assert len(weights) < 3, 'More than one children unbalanced for %s.' % self.names[p]
 
         weights = list(weights.items())
-        if len(weights) == 1:
+        if len(weights) <= 1:
             # children balanced - return None
             return None
         elif len(weights[0][1]) == 1:
-            # first tree weight unbalanced - return child name and adjustment
+            # first tree weight unbalanced - return child and adjustment
             return (weights[0][1][0], weights[1][0]-weights[0][0])
         elif len(weights[1][1]) == 1:
-            # second tree weight unbalanced - return child name and adjustment
+            # second tree weight unbalanced - return child and adjustment
             return (weights[1][1][0], weights[0][0]-weights[1][0])
         else:
             assert False, 'WTF?'
 
+def parse_input(specifier):
+    tower = Tower()
+    for l in aoc.input_lines(7, specifier):
+        if l.strip():
+            tower.add(l)
+    return tower
 
-# part 1 - read input
-progs = {}
-with open(INPUT) as f:
-    for l in f:
-        p = Node(l)
-        progs[p.name] = p
+@functools.cache
+def read_tower(specifier):
+    # read input, once - the cached tower is built by the methods of
+    # Tower, so they version it too
+    return aoc.cached_parse(7, specifier, parse_input, version=aoc.code_version(parse_input, Tower))
 
-# part 1 - loop and remove leaves
-while len(progs) > 1:
-    leaves = set(filter(lambda n: len(progs[n].children) == 0, progs))
-    for l in leaves:
-        del progs[l]
-    for p in progs:
-        progs[p].children = progs[p].children - leaves
-root = list(progs.keys())[0]
-print(root)
+def part1(specifier=None):
+    ''' The root is the only program without a parent. '''
+    tower = read_tower(specifier)
+    return tower.names[tower.root()]
 
-# part 2 - read input (again)
-with open(INPUT) as f:
-    for l in f:
-        p = Node(l)
-        progs[p.name] = p
+def part2(specifier=None):
+    ''' Traverse from root, following unbalanced. The first node we find
+        that has balanced children, has to be adjusted.
+    '''
+    tower = read_tower(specifier)
+    root = tower.root()
+    tweights = tower.tree_weights(root)
+    prv = None
+    cur = tower.unbalanced(root, tweights)
+    while cur is not None:
+        prv = cur
+        cur = tower.unbalanced(cur[0], tweights)
+    logging.debug('Program to adjust: %s' % tower.names[prv[0]])
+    return tower.weights[prv[0]]+prv[1]
 
-# part 2 - traverse from root, following unbalanced
-# the first node we find that has balanced children, has to be adjusted
-prv = None
-cur = progs[root].get_unbalanced(progs)
-while cur is not None:
-    #print(progs[cur[0]])
-    prv = cur
-    cur = progs[cur[0]].get_unbalanced(progs)
-print(prv[0], progs[prv[0]].weight+prv[1])
+if __name__ == '__main__':
+    aoc.run(part1, part2)
 
 # vim:sts=4:sw=4:et:
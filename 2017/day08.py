@@ -1,50 +1,175 @@
 #!/usr/bin/env python3
+import os
 import sys
-from pathlib import Path as _P
-import re
-
-INPUT_DEFAULT = _P(__file__).with_name('%s-input.txt' % _P(__file__).stem)
-INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT_DEFAULT
-
-# wrapper class
-class Ins:
-    def __init__(self, line):
-        node, sep, children = l.partition('->')
-        node_match = re.match(r'(?P<name>[a-z]+)\s+\((?P<weight>[0-9]+)\)\s*', node)
-        if not node_match:
-            raise Exception('Bad line: %s\n' % line)
-        self.name = node_match.group('name')
-        self.weight = int(node_match.group('weight'))
-        self.children = set() if not children else set([c.strip() for c in children.split(',')])
-        self.tweight = None
-
-    def __str__(self):
-        return '%s (%d) -> %s' % (self.name, self.weight, self.children)
-
-    def __repr__(self):
-        return self.__str__()
-
-
-# part 1 - read input
-regs = {}
-gmax = 0
-with open(INPUT) as f:
-    for l in f:
-        reg, op, arg, _if, ifreg, ifcond, ifarg = l.split()
-        assert op in ['inc', 'dec'], 'Invalid op: %s' % op
-        assert ifcond in ['==', '!=', '<', '>', '<=', '>='], 'Invalid conditional: %s' % ifcond
-
-        if reg not in regs:
-            regs[reg] = 0
-        if ifreg not in regs:
-            regs[ifreg] = 0
-        arg = int(arg) if op == 'inc' else -int(arg)
-        ifarg = int(ifarg)
-
-        print(reg, op, arg, _if, ifreg, ifcond, ifarg)
-        if eval('%d %s %d' % (regs[ifreg], ifcond, ifarg)):
-            regs[reg] += arg
-            if regs[reg] > gmax: gmax = regs[reg]
-
-print(max(regs.values()), gmax)
+import operator
+import functools
+import aoc
+
+# execution engine: table, compiled, or profiled (the table, collecting
+# instruction statistics reported on stderr)
+ENGINE = os.environ.get('AOC_ENGINE', 'table')
+COMPILE_SEGMENT = 1000
+
+CONDITIONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+SYMBOLS = {cond: symbol for symbol, cond in CONDITIONS.items()}
+
+class Program:
+    ''' The program parsed once into an instruction table. Registers are
+        interned to slots of a flat list, and every instruction is a
+        tuple (slot, delta, condition slot, comparison, argument).
+    '''
+    def __init__(self, lines):
+        self.slots = {}
+        self.table = []
+        for l in lines:
+            if not l.strip():
+                continue
+            reg, op, arg, _if, ifreg, ifcond, ifarg = l.split()
+            assert op in ['inc', 'dec'], 'Invalid op: %s' % op
+            assert ifcond in CONDITIONS, 'Invalid conditional: %s' % ifcond
+            delta = int(arg) if op == 'inc' else -int(arg)
+            self.table.append((self.slot(reg), delta, self.slot(ifreg), CONDITIONS[ifcond], int(ifarg)))
+        self._compiled = None
+
+    def slot(self, reg):
+        return self.slots.setdefault(reg, len(self.slots))
+
+    def run(self):
+        ''' Interpret the instruction table. Return the registers and the
+            largest value held by a register during the run.
+        '''
+        regs = [0] * len(self.slots)
+        gmax = 0
+        for r, delta, c, cond, arg in self.table:
+            if cond(regs[c], arg):
+                v = regs[r] = regs[r] + delta
+                if v > gmax: gmax = v
+        return regs, gmax
+
+    def run_profiled(self, stats):
+        ''' Same as run(), also counting in stats how often every
+            instruction is executed and taken, and every register tested
+            and written.
+            Kept apart from run(), which pays nothing for it.
+        '''
+        executed, taken, reads, writes = stats.executed, stats.taken, stats.reads, stats.writes
+        regs = [0] * len(self.slots)
+        gmax = 0
+        for pc, (r, delta, c, cond, arg) in enumerate(self.table):
+            executed[pc] += 1
+            reads[c] += 1
+            if cond(regs[c], arg):
+                taken[pc] += 1
+                writes[r] += 1
+                v = regs[r] = regs[r] + delta
+                if v > gmax: gmax = v
+        return regs, gmax
+
+    def compile(self):
+        ''' Compile the program into Python functions, with the same result
+            as run(). A single function for a very long program would take
+            the compiler too much memory, so every COMPILE_SEGMENT
+            instructions get their own function, run one after another.
+        '''
+        if self._compiled is None:
+            segments = []
+            for start in range(0, len(self.table), COMPILE_SEGMENT):
+                src = ['def segment(regs, gmax):']
+                for r, delta, c, cond, arg in self.table[start:start+COMPILE_SEGMENT]:
+                    src.append('    if regs[%d] %s %d:' % (c, SYMBOLS[cond], arg))
+                    src.append('        v = regs[%d] = regs[%d] + %d' % (r, r, delta))
+                    src.append('        if v > gmax: gmax = v')
+                src.append('    return gmax')
+                namespace = {}
+                exec(compile('\n'.join(src), '<program:%d>' % (start+1), 'exec'), namespace)
+                segments.append(namespace['segment'])
+
+            def run():
+                regs = [0] * len(self.slots)
+                gmax = 0
+                for segment in segments:
+                    gmax = segment(regs, gmax)
+                return regs, gmax
+            self._compiled = run
+        return self._compiled
+
+class Stats:
+    ''' Execution counters of a program, preallocated for all its
+        instructions and registers, and accumulated over runs.
+    '''
+    def __init__(self, program):
+        self.program = program
+        self.executed = [0] * len(program.table)
+        self.taken = [0] * len(program.table)
+        self.reads = [0] * len(program.slots)
+        self.writes = [0] * len(program.slots)
+
+    def report(self, top=10):
+        ''' The hot spots of the program: the most executed instructions
+            with their taken ratio, the registers used most, and the
+            taken ratio of every comparison. The program has no jumps, so
+            every instruction is executed once per run, and instructions
+            mostly stand apart by how often they are taken.
+        '''
+        names = sorted(self.program.slots, key=self.program.slots.get)
+        table = self.program.table
+        lines = ['%d instructions executed, %d taken' % (sum(self.executed), sum(self.taken))]
+
+        lines.append('hot instructions:')
+        hot = sorted(range(len(table)), key=lambda pc: (-self.executed[pc], -self.taken[pc], pc))
+        for pc in hot[:top]:
+            r, delta, c, cond, arg = table[pc]
+            lines.append('  %5d: %s %+d if %s %s %d  executed %d, taken %.1f%%' % (
+                pc+1, names[r], delta, names[c], SYMBOLS[cond], arg,
+                self.executed[pc], 100 * self.taken[pc] / max(self.executed[pc], 1)))
+
+        lines.append('hot registers:')
+        hot = sorted(range(len(names)), key=lambda s: (-self.reads[s] - self.writes[s], s))
+        for slot in hot[:top]:
+            lines.append('  %s: %d tests, %d writes' % (names[slot], self.reads[slot], self.writes[slot]))
+
+        lines.append('conditions:')
+        by_cond = {}
+        for pc, (r, delta, c, cond, arg) in enumerate(table):
+            n, t = by_cond.get(cond, (0, 0))
+            by_cond[cond] = (n + self.executed[pc], t + self.taken[pc])
+        for cond, (n, t) in sorted(by_cond.items(), key=lambda i: -i[1][0]):
+            lines.append('  %-2s executed %d, taken %.1f%%' % (SYMBOLS[cond], n, 100 * t / max(n, 1)))
+        return '\n'.join(lines)
+
+def parse_input(specifier):
+    return Program(aoc.input_lines(8, specifier))
+
+@functools.cache
+def execute(specifier, engine=ENGINE):
+    # the cached program is built by Program, which versions it too
+    program = aoc.cached_parse(8, specifier, parse_input, version=aoc.code_version(parse_input, Program))
+    if engine == 'profiled':
+        stats = Stats(program)
+        result = program.run_profiled(stats)
+        print('Program statistics:\n%s' % stats.report(), file=sys.stderr)
+        return result
+    elif engine == 'compiled':
+        return program.compile()()
+    else:
+        return program.run()
+
+def part1(specifier=None):
+    regs, gmax = execute(specifier)
+    return max(regs)
+
+def part2(specifier=None):
+    regs, gmax = execute(specifier)
+    return gmax
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
+
 # vim:sts=4:sw=4:et:
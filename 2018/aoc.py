@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+''' Helpers shared by the 2018 solutions.
+'''
+import importlib
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+# the disk caches are implemented once, in the helpers of 2021
+AOC2021 = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '2021', 'aoc.py')
+
+
+# ------------------------------------------------
+# Deferred imports.
+# ------------------------------------------------
+class LazyModule(types.ModuleType):
+    ''' Placeholder for a module that is imported when one of its
+        attributes is first accessed.
+    '''
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    ''' Defer importing a module until it is actually used.
+        Used for plotting and solver backends that are only needed on
+        some code paths (e.g. matplotlib when visualizing the board).
+    '''
+    return sys.modules[name] if name in sys.modules else LazyModule(name)
+
+
+def aoc2021():
+    ''' The aoc module of 2021, imported from its file as aoc2021: the
+        scripts of this year import this module as aoc.
+    '''
+    if 'aoc2021' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('aoc2021', AOC2021)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['aoc2021'] = module
+        spec.loader.exec_module(module)
+    return sys.modules['aoc2021']
+
+
+# ------------------------------------------------
+# Memoization, in process and on disk.
+# ------------------------------------------------
+def memoize(disk=False, max_entries=128, max_bytes=None, version=None):
+    ''' Decorator caching the results of a pure function: memoize() of
+        2021/aoc.py, with the disk entries in cache/ of this year.
+        Arguments must include everything the result depends on, e.g.
+        the puzzle input, not just what varies within a run.
+    '''
+    return aoc2021().memoize(disk=disk, max_entries=max_entries, max_bytes=max_bytes, version=version,
+                             cache_dir=Path(CACHE_DIR))
+
+# vim:sts=4:sw=4:et:
@@ -1,26 +1,66 @@
 #!/usr/bin/env python3
-from pprint import pprint
+import sys
+import itertools
+import numpy
 INPUT = 'd01-input.txt'
 
-i = 0
-s = 0
-sum1 = 0
-freqs = set()
-calibr = None
-
-while calibr is None:
-    with open(INPUT) as f:
-        for l in f:
-            if calibr is None:
-                if s in freqs:
-                    calibr = s
-                else:
-                    freqs.add(s)
-            c = int(l)
-            #print('%d + %d -> %d' % (s, c, s+c))
-            s += c
-    if  i == 0:
-        sum1 = s
+def first_repeat_bruteforce(deltas):
+    ''' Apply the deltas over and over, until a frequency shows up twice. '''
+    s = 0
+    freqs = set()
+    for c in itertools.cycle(deltas.tolist()):
+        if s in freqs:
+            return s
+        freqs.add(s)
+        s += c
+
+def first_repeat(deltas):
+    ''' The frequency before delta i in pass k is p[i] + k*drift, with p
+        the prefix sums of the first pass and drift their total. Two
+        positions can only ever share a frequency if their prefix sums
+        are congruent modulo the drift, so the prefix sums are grouped by
+        residue and sorted: frequency p[i] is repeated when position j
+        catches up with it, after (p[i]-p[j])/drift passes, and the
+        earliest repeat of every group is with its neighbour in sorted
+        order. Returns None if no frequency is ever repeated.
+    '''
+    n = len(deltas)
+    p = numpy.concatenate([[0], numpy.cumsum(deltas)[:-1]])
+    drift = int(deltas.sum())
+
+    # a frequency repeated in the first pass comes first
+    order = numpy.argsort(p, kind='stable')
+    dup = numpy.flatnonzero(p[order][1:] == p[order][:-1])
+    if len(dup) > 0:
+        return int(p[order[dup + 1].min()])
+
+    if drift == 0:
+        return first_repeat_bruteforce(deltas)
+
+    # with a negative drift, frequencies go down: flip the signs
+    sign = 1 if drift > 0 else -1
+    q, d = sign * p, sign * drift
+    order = numpy.lexsort((q, q % d))
+    q_sorted = q[order]
+    same = (q_sorted[1:] % d) == (q_sorted[:-1] % d)
+    if not same.any():
+        return None
+    # position j = order[:-1] reaches frequency q[order[1:]] after that many passes
+    j, target = order[:-1][same], order[1:][same]
+    passes = (q[target] - q[j]) // d
+    steps = passes * n + j
+    return int(p[target[numpy.argmin(steps)]])
+
+deltas = numpy.loadtxt(INPUT, dtype=numpy.int64, ndmin=1)
+
+# part 1
+sum1 = int(deltas.sum())
+
+# part 2
+calibr = first_repeat(deltas)
+if calibr is None:
+    print('No frequency is ever reached twice.', file=sys.stderr)
+    sys.exit(1)
 
 print('%d %d' % (sum1, calibr))
 
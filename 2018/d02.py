@@ -1,42 +1,47 @@
 #!/usr/bin/env python3
+import sys
 import numpy
 from pprint import pprint
 INPUT = 'd02-input.txt'
 
 with open(INPUT) as f:
-    lines = list(map(str.strip, f.readlines()))
+    lines = [l.strip() for l in f if l.strip()]
 
 # ------------------------------------------------
 
-twos = 0
-threes = 0
-
-for l in lines:
-    chars, counts = numpy.unique(list(l), return_counts=True)
-    twos += (2 in counts)
-    threes += (3 in counts)
+# all IDs as rows of letters 0-25, in one array
+ids = numpy.frombuffer(''.join(lines).encode(), dtype=numpy.uint8).reshape(len(lines), -1) - ord('a')
+assert ids.max() < 26, 'ID with other characters than lowercase letters in input.'
+rows = numpy.repeat(numpy.arange(len(lines)), ids.shape[1])
+counts = numpy.bincount(rows * 26 + ids.ravel(), minlength=len(lines) * 26).reshape(-1, 26)
+twos = numpy.count_nonzero((counts == 2).any(axis=1))
+threes = numpy.count_nonzero((counts == 3).any(axis=1))
 
 print('%d * %d = %d' % (twos, threes, twos*threes))
 print('------------------------------------------------')
 
 # ------------------------------------------------
 
-# Note that we need to wrap result in list() when
-# calculating numlines. Otherwise the loop will stop
-# when the first map is exhausted.
-l2n = lambda l: list(map(ord, l))
-numlines1 = list(map(l2n, lines))
-numlines2 = list(map(l2n, lines))
-diffs = []
-
-for i1, l1 in enumerate(numlines1):
-    for i2, l2 in enumerate(numlines2):
-        if (not i1 < i2): continue;
-        d = numpy.not_equal(l1, l2)
-        s = numpy.sum(d)
-        diffs.append((s, (i1, i2)))
-
-s, (i1, i2) = min(diffs)
+def near_duplicate(lines):
+    ''' Return the first pair of lines differing by exactly one
+        character, as their indices. Every line is bucketed under each
+        of its keys with one position masked, so two lines share a
+        bucket when they only differ at that position.
+    '''
+    buckets = {}
+    for i2, l2 in enumerate(lines):
+        for k in range(len(l2)):
+            key = (k, l2[:k] + l2[k+1:])
+            i1 = buckets.setdefault(key, i2)
+            if i1 != i2 and lines[i1] != l2:
+                return i1, i2
+    return None
+
+pair = near_duplicate(lines)
+if pair is None:
+    print('No IDs differ by exactly one character.', file=sys.stderr)
+    sys.exit(1)
+i1, i2 = pair
 l1 = lines[i1]
 l2 = lines[i2]
 common = ''
@@ -2,49 +2,81 @@
 import re
 import sys
 import numpy
-from pprint import pprint
 INPUT = 'd03-input.txt'
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
+
+# fabrics with more square inches than this are handled in sparse mode
+DENSE_LIMIT = 2**24
 
 line_re = re.compile(r'#(?P<id>\d+) @ (?P<x>\d+),(?P<y>\d+): (?P<w>\d+)x(?P<h>\d+)')
+claim_dtype = numpy.dtype([
+    ('id', numpy.int64),
+    ('x', numpy.int64),
+    ('y', numpy.int64),
+    ('w', numpy.int64),
+    ('h', numpy.int64),
+])
 
 # ------------------------------------------------
 
-W = 0
-H = 0
+claims = []
 with open(INPUT) as f:
     for ln, line in enumerate(f):
         m = line_re.match(line.strip())
         if m is None:
             print('Bad input on line %d: %s' % (ln, line.strip()), file=sys.stderr)
             sys.exit(1)
-        claim = {k: int(v) for k, v in m.groupdict().items()}
-        W = max(W, claim['x'] + claim['w'])
-        H = max(H, claim['y'] + claim['h'])
+        claims.append(tuple(int(v) for v in m.groups()))
+claims = numpy.array(claims, dtype=claim_dtype)
+
+W = int((claims['x'] + claims['w']).max())
+H = int((claims['y'] + claims['h']).max())
 print('fabric size: %dx%d' % (W, H))
 
 # ------------------------------------------------
 
+def claim_counts(claims, sparse):
+    ''' Count the claims over every cell of the fabric, by adding the
+        corners of every claim to a 2D difference array and summing it
+        up along both axes. In sparse mode the cells are the rectangles
+        between the claim edges, instead of square inches. Return the
+        counts, the area of every cell, and the claims as cell ranges.
+    '''
+    x0, x1 = claims['x'], claims['x'] + claims['w']
+    y0, y1 = claims['y'], claims['y'] + claims['h']
+    if sparse:
+        xs = numpy.unique(numpy.concatenate([x0, x1]))
+        ys = numpy.unique(numpy.concatenate([y0, y1]))
+        x0, x1 = numpy.searchsorted(xs, x0), numpy.searchsorted(xs, x1)
+        y0, y1 = numpy.searchsorted(ys, y0), numpy.searchsorted(ys, y1)
+        area = numpy.outer(numpy.diff(ys), numpy.diff(xs))
+    else:
+        xs, ys = numpy.arange(W+1), numpy.arange(H+1)
+        area = numpy.ones((H, W), dtype=numpy.int64)
+
+    diff = numpy.zeros((len(ys), len(xs)), dtype=numpy.int32)
+    numpy.add.at(diff, (y0, x0), 1)
+    numpy.add.at(diff, (y0, x1), -1)
+    numpy.add.at(diff, (y1, x0), -1)
+    numpy.add.at(diff, (y1, x1), 1)
+    counts = diff.cumsum(axis=0).cumsum(axis=1)[:-1, :-1]
+    return counts, area, (x0, x1, y0, y1)
+
+sparse = W * H > DENSE_LIMIT
+counts, area, (x0, x1, y0, y1) = claim_counts(claims, sparse)
+
 # part 1
-fabric = numpy.zeros((H, W), dtype=numpy.uint16)
-with open(INPUT) as f:
-    for ln, line in enumerate(f):
-        m = line_re.match(line.strip())
-        claim = {k: int(v) for k, v in m.groupdict().items()}
-        fslice = fabric[claim['y']:claim['y']+claim['h'], claim['x']:claim['x']+claim['w']]
-        patch = numpy.ones((claim['h'], claim['w']), dtype=numpy.uint16)
-        fslice += patch
-print('overlapping bits: %d' % len(fabric[fabric>1]))
+print('overlapping bits: %d' % area[counts > 1].sum())
 
 # ------------------------------------------------
 
-# part 2
-with open(INPUT) as f:
-    for ln, line in enumerate(f):
-        m = line_re.match(line.strip())
-        claim = {k: int(v) for k, v in m.groupdict().items()}
-        fslice = fabric[claim['y']:claim['y']+claim['h'], claim['x']:claim['x']+claim['w']]
-        patch = numpy.ones((claim['h'], claim['w']), dtype=numpy.uint16)
-        if numpy.array_equal(fslice, patch):
-            print('claim with no overlaps: %d' % claim['id'])
+# part 2 - every cell of a claim has at least its count, so a claim has
+# no overlaps when the counts over it sum to its own area: summed over
+# all claims at once, with a summed-area table
+sat = numpy.zeros((counts.shape[0]+1, counts.shape[1]+1), dtype=numpy.int64)
+sat[1:, 1:] = (counts * area).cumsum(axis=0).cumsum(axis=1)
+covered = sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0]
+for claim_id in claims['id'][covered == claims['w'] * claims['h']]:
+    print('claim with no overlaps: %d' % claim_id)
 
 # vim:sts=4:sw=4:et:
@@ -1,65 +1,74 @@
 #!/usr/bin/env python3
-import re
 import sys
-import datetime
+import numpy
 from pprint import pprint
 INPUT = 'd04-input.txt'
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
-line_re = re.compile(r'\[(?P<ts>[^x]+)\] (.* #(?P<id>\d+) )?.*(?P<action>(wakes|asleep|begins))')
-time_fmt = '%Y-%m-%d %H:%M'
+# [1518-11-01 00:05] falls asleep
+# the fields are at fixed offsets: timestamp digits, then the first
+# letter of the action (G, f or w), then the guard id of G lines
+DIGITS = [1, 2, 3, 4, 6, 7, 9, 10, 12, 13, 15, 16]
+ACTION = 19
+GUARD_ID = 26
 
 # ------------------------------------------------
 
-events = []
-with open(INPUT) as f:
-    for ln, line in enumerate(f):
-        m = line_re.search(line.strip())
-        if m is None:
-            print('Bad input on line %d: %s' % (ln, line.strip()), file=sys.stderr)
-            sys.exit(1)
-        e = m.groupdict()
-        e['id'] = int(e['id']) if e['id'] is not None else None
-        e['ts'] = datetime.datetime.strptime(e['ts'], time_fmt)
-        assert(e['id'] is None or e['action'] == 'begins')
-        events.append(e)
-events.sort(key = lambda e: e['ts'])
+with open(INPUT, 'rb') as f:
+    lines = [l.rstrip() for l in f if l.strip()]
+raw = numpy.array(lines, dtype='S%d' % max(len(l) for l in lines))
+raw = raw.view(numpy.uint8).reshape(len(lines), -1)
+
+# timestamps as integers yyyymmddHHMM, which sort like the timestamps
+digits = raw[:, DIGITS].astype(numpy.int64) - ord('0')
+bad = ((digits < 0) | (digits > 9)).any(axis=1) | ~numpy.isin(raw[:, ACTION], list(b'Gfw'))
+if bad.any():
+    ln = numpy.flatnonzero(bad)[0]
+    print('Bad input on line %d: %s' % (ln, lines[ln].decode()), file=sys.stderr)
+    sys.exit(1)
+ts = digits @ (10 ** numpy.arange(len(DIGITS) - 1, -1, -1))
+
+order = numpy.argsort(ts, kind='stable')
+ts, actions = ts[order], raw[order, ACTION]
+hour, minute = ts // 100 % 100, ts % 100
+
+# every event is by the guard of the last shift begun
+begins = actions == ord('G')
+assert begins[0], 'Log does not start with a shift.'
+ids = numpy.array([int(lines[i][GUARD_ID:].split()[0]) for i in order[begins]])
+guard_ids, guard_of_shift = numpy.unique(ids, return_inverse=True)
+guard = guard_of_shift[numpy.cumsum(begins) - 1]
 
 # ------------------------------------------------
 
-guards = {}
-dt = datetime.timedelta(minutes=1)
-for e in events:
-        if e['action'] == 'begins':
-            guard_id = e['id']
-            if guard_id not in guards:
-                guards[guard_id] = 60 * [0,]
-        elif e['action'] == 'asleep':
-            asleep_ts = e['ts']
-            asleep_id = guard_id
-        elif e['action'] == 'wakes':
-            wake_ts = e['ts']
-            assert(asleep_id == guard_id)
-            assert(wake_ts > asleep_ts)
-            while asleep_ts < wake_ts:
-                guards[guard_id][asleep_ts.minute] += 1
-                asleep_ts += dt
+# every falls asleep is followed by a wakes up of the same shift, in the
+# same hour: accumulate the intervals in a difference array per guard
+asleep = numpy.flatnonzero(actions == ord('f'))
+wakes = numpy.flatnonzero(actions == ord('w'))
+assert len(asleep) == len(wakes) and (wakes == asleep + 1).all(), 'Unmatched falls asleep/wakes up.'
+assert (hour[asleep] == hour[wakes]).all() and (minute[wakes] > minute[asleep]).all(), 'Sleep out of the hour.'
+diff = numpy.zeros((len(guard_ids), 61), dtype=numpy.int64)
+numpy.add.at(diff, (guard[asleep], minute[asleep]), 1)
+numpy.add.at(diff, (guard[asleep], minute[wakes]), -1)
+guards = diff.cumsum(axis=1)[:, :60]
 
 # ------------------------------------------------
 
 # part 1
-sleepy_guard_id = max(guards, key=lambda key: sum(guards[key]))
-sleepy_guard_minute = max(enumerate(guards[sleepy_guard_id]), key=lambda it: it[1])
-print('%d * %d = %d' % (sleepy_guard_id, sleepy_guard_minute[0], sleepy_guard_id*sleepy_guard_minute[0]))
+sleepy_guard = numpy.argmax(guards.sum(axis=1))
+sleepy_guard_id = guard_ids[sleepy_guard]
+sleepy_guard_minute = numpy.argmax(guards[sleepy_guard])
+print('%d * %d = %d' % (sleepy_guard_id, sleepy_guard_minute, sleepy_guard_id*sleepy_guard_minute))
 
 # ------------------------------------------------
 
 # part 2
-sleepiest_minutes = { k: max(enumerate(v), key=lambda it: it[1])[0] for k, v in guards.items() }
-consistently_sleepy_guard_id = max(sleepiest_minutes, key=lambda key: guards[key])
+consistently_sleepy_guard, sleepiest_minute = numpy.unravel_index(numpy.argmax(guards), guards.shape)
+consistently_sleepy_guard_id = guard_ids[consistently_sleepy_guard]
 print('%d * %d = %d' % (
     consistently_sleepy_guard_id,
-    sleepiest_minutes[consistently_sleepy_guard_id],
-    consistently_sleepy_guard_id * sleepiest_minutes[consistently_sleepy_guard_id]
+    sleepiest_minute,
+    consistently_sleepy_guard_id * sleepiest_minute
 ))
 
 # vim:sts=4:sw=4:et:
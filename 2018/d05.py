@@ -1,55 +1,79 @@
 #!/usr/bin/env python3
+import os
 import sys
-from pprint import pprint
+from multiprocessing import Pool
 INPUT = 'd05-input.txt'
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
+
+# polymers longer than this are reduced by a process pool, in chunks
+POOL_THRESHOLD = 2**20
+CHUNK_SIZE = 2**20
 
 # ------------------------------------------------
 
-def process(stack, chars):
-    for cn, c in enumerate(chars):
-        #print(c, stack) # slow
-        stack.append(c)
-
-        if (len(stack) < 2):
-            continue
-        v0 = stack.pop()
-        v1 = stack.pop()
-        cv0 = v0.casefold()
-        cv1 = v1.casefold()
-
-        if cv0 != cv1:
-            stack.append(v1)
-            stack.append(v0)
-            continue
-        elif v0 == v1:
-            stack.append(v1)
-            stack.append(v0)
-            continue
+# Units are bytes, and a unit reacts with the same letter of the other
+# polarity: their ASCII codes only differ by the case bit, 0x20.
+
+def react(polymer):
+    ''' Reduce a polymer, using the result as a stack of the units left. '''
+    stack = bytearray()
+    for c in polymer:
+        if stack and stack[-1] ^ c == 0x20:
+            stack.pop()
         else:
-            continue
+            stack.append(c)
+    return stack
+
+def merge(a, b):
+    ''' Join two reduced polymers. Only units around the junction can
+        react, so a reduced concatenation is the same as a reduced whole.
+    '''
+    i = 0
+    while a and i < len(b) and a[-1] ^ b[i] == 0x20:
+        a.pop()
+        i += 1
+    a += b[i:]
+    return a
+
+def react_chunks(pool, polymer):
+    ''' Reduce chunks of a long polymer in parallel, and merge them. '''
+    chunks = (polymer[i:i+CHUNK_SIZE] for i in range(0, len(polymer), CHUNK_SIZE))
+    reduced = bytearray()
+    for chunk in pool.imap(react, chunks):
+        reduced = merge(reduced, chunk)
+    return reduced
+
+def remove_and_react(args):
+    polymer, unit = args
+    return unit, len(react(polymer.translate(None, bytes([unit, unit ^ 0x20]))))
 
 # ------------------------------------------------
 
+with open(INPUT, 'rb') as f:
+    polymer = f.read().strip()
+assert polymer.isalpha(), 'Polymer with other units than letters in input.'
+
+pool = Pool() if len(polymer) > POOL_THRESHOLD and os.cpu_count() > 1 else None
+
 # part 1
-stack = []
-with open(INPUT) as f:
-    for ln, line in enumerate(f):
-        line = line.strip()
-        process(stack, line)
-print(len(stack))
+if pool is not None:
+    reduced = react_chunks(pool, polymer)
+else:
+    reduced = react(polymer)
+print(len(reduced))
 
 # ------------------------------------------------
 
-# part 2
-test_chars = set(''.join(stack).casefold())
-test_results = {}
-for c in sorted(test_chars):
-    test_stack = []
-    test_input = [ sc for sc in stack if sc.casefold() != c.casefold() ]
-    process(test_stack, test_input)
-    #print(c, len(test_stack), test_stack)
-    test_results[c] = test_stack
-bestc = min(test_results, key=lambda key: len(test_results[key]))
-print(len(test_results[bestc]))
+# part 2 - removing a unit and reducing commutes with reducing, so the
+# reduced polymer of part 1 is the base for every unit removed
+reduced = bytes(reduced)
+tasks = [(reduced, unit) for unit in sorted(set(reduced.lower()))]
+if pool is not None:
+    results = dict(pool.imap_unordered(remove_and_react, tasks))
+    pool.close()
+else:
+    results = dict(map(remove_and_react, tasks))
+bestc = min(results, key=lambda unit: (results[unit], unit))
+print(results[bestc])
 
 # vim:sts=4:sw=4:et:
@@ -2,8 +2,9 @@
 import sys
 import re
 from pprint import pprint
-from termcolor import colored
 from progress.bar import IncrementalBar
+import aoc
+termcolor = aoc.lazy_import('termcolor')
 
 INPUT = 'd09-input.txt'
 DEBUG = False
@@ -103,8 +104,8 @@ class MarbleBoard:
 
 class MarbleGame:
     mplain_fmt = lambda n: ' %d' % (n)
-    mbold_fmt = lambda n: ' %s' % (colored(n, 'green'))
-    round_fmt = lambda n: colored('[%3d]' % (n), 'red')
+    mbold_fmt = lambda n: ' %s' % (termcolor.colored(n, 'green'))
+    round_fmt = lambda n: termcolor.colored('[%3d]' % (n), 'red')
 
     score_multipleof = 23
     score_backsteps = 7
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import sys
 import re
-from matplotlib import pyplot
 import numpy
 from pprint import pprint
+import aoc
+pyplot = aoc.lazy_import('matplotlib.pyplot')
 
 INPUT = 'd10-input.txt'
 line_re = re.compile('position=< *(?P<x>-?\d+), *(?P<y>-?\d+)> *velocity=< *(?P<vx>-?\d+), *(?P<vy>-?\d+)>.*')
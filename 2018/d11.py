@@ -4,6 +4,7 @@ import re
 import numpy
 from pprint import pprint
 from multiprocessing import Pool
+import aoc
 
 INPUT = 'd11-input.txt'
 GRIDW = 300
@@ -20,6 +21,9 @@ DEBUG = False
 # sq(n-1) has already been calculated. However, after this optimization
 # using the multiprocessing module will be much more complex.
 #
+# The best square of each dimension is memoized on disk, so that reruns
+# (and part 2, for the dimension of part 1) don't recalculate it.
+#
 # Note: We use x, y to refer to grid coords (base-1).
 #       We use j, i to refer to array indices (base-0).
 #
@@ -42,7 +46,8 @@ def calculate_square_power(coords, gridno, sqdim):
     i, j = y-1, x-1
     return cell_power[i:i+sqdim, j:j+sqdim].sum()
 
-def best_square(sqdim):
+@aoc.memoize(disk=True, max_entries=512)
+def best_square(gridno, sqdim):
     max_power = 0
     max_coords = None
     for y in range(1, GRIDH+1):
@@ -72,14 +77,14 @@ for i in numpy.arange(GRIDH):
 # part 1
 # ------------------------------------------------
 sqdim = 3
-print(best_square(sqdim))
+print(best_square(gridno, sqdim))
 
 # ------------------------------------------------
 # part 2
 # ------------------------------------------------
 pool = Pool()
 dims = list(range(1, min(GRIDW, GRIDH)+1))
-r = pool.map_async(best_square, dims)
+r = pool.starmap_async(best_square, [(gridno, sqdim) for sqdim in dims])
 best = max(r.get(), key=lambda t: t[2])
 print(best)
 
@@ -7,6 +7,7 @@ INPUT = 'd12-input.txt'
 DEBUG = False
 if DEBUG:
     INPUT = 'd12-input-example.txt'
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # read a rule from input
 rule_re = re.compile(r'(?P<pattern>[.#]+)\s*=>\s*(?P<out>[.#])\s*')
@@ -3,11 +3,13 @@ import re
 import sys
 import numpy
 from collections import Counter
-from matplotlib import pyplot
+import aoc
+pyplot = aoc.lazy_import('matplotlib.pyplot')
 INPUTS = [ 'd13-input.txt', 'd13-input-example1.txt', 'd13-input-example2.txt', 'd13-input-test0.txt' ]
 
 DEBUG = False
 INPUT = INPUTS[3] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # useful constants
@@ -4,8 +4,9 @@ import sys
 import itertools
 import numpy as np
 import networkx as nx
-from matplotlib import pyplot
 from pprint import pprint
+import aoc
+pyplot = aoc.lazy_import('matplotlib.pyplot')
 INPUTS = [ 'd15-input.txt',
         'd15-input-example1.txt', 'd15-input-example2.txt', 'd15-input-example3.txt',
         'd15-input-example4.txt', 'd15-input-example5.txt', 'd15-input-example6.txt',
@@ -16,6 +17,7 @@ INPUTS = [ 'd15-input.txt',
 DEBUG = False
 DEBUG_STEP = False
 INPUT = INPUTS[13] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # constants and global state
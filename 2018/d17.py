@@ -10,6 +10,7 @@ INPUTS = [ 'd17-input.txt', 'd17-input-example.txt' ]
 DEBUG = False
 PRINT_LINENO = False
 INPUT = INPUTS[0] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # helpers
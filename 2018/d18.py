@@ -5,12 +5,14 @@ import hashlib
 import itertools
 import numpy as np
 from collections import Counter
-from matplotlib import pyplot
 from pprint import pprint
+import aoc
+pyplot = aoc.lazy_import('matplotlib.pyplot')
 INPUTS = [ 'd18-input.txt', 'd18-input-example.txt']
 
 DEBUG = False
 INPUT = INPUTS[1] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # helpers
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 import re
 import sys
-import sympy
-from sympy.utilities.lambdify import lambdify
 from pprint import pprint
+import aoc
+sympy = aoc.lazy_import('sympy')
 INPUT = 'd19-input.txt'
 DEBUG = True
 
@@ -210,7 +210,7 @@ class AoCVM:
                 print('C', ip_str, sregv, file=sys.stderr)
                 break
 
-        self.opt[ip_start] = (lambdify(sreg, sregv, ('math')), bbl)
+        self.opt[ip_start] = (sympy.lambdify(sreg, sregv, ('math')), bbl)
         return self.opt[ip_start]
 
     def get_opcodes(self, opcode_specfile):
@@ -6,6 +6,7 @@ from pprint import pprint
 INPUTS = ['d20-input.txt', 'd20-input-example1.txt']
 DEBUG = False
 INPUT = INPUTS[1] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # helpers
@@ -2,19 +2,17 @@
 import sys
 import re
 import itertools
-import hashlib
-import os
 import numpy as np
-import networkx as nx
-from scipy.spatial import distance
-from scipy.sparse import csr_matrix
-from scipy.sparse import csgraph
 from pprint import pprint
+import aoc
+nx = aoc.lazy_import('networkx')
+sparse = aoc.lazy_import('scipy.sparse')
+csgraph = aoc.lazy_import('scipy.sparse.csgraph')
 
-CACHE_DIR = 'd22_cache'
 INPUTS = [ 'd22-input.txt', 'd22-input-example.txt']
 DEBUG = False
 INPUT = INPUTS[1] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # switches between scipy and networkx for part 2
 USENX = True
@@ -22,6 +20,36 @@ USENX = True
 # ------------------------------------------------
 # Class modeling the cave.
 # ------------------------------------------------
+@aoc.memoize(disk=True, max_entries=4)
+def cave_grids(target, max_depth, max_width):
+    ''' Calculate the geologic index, erosion level and type grids of
+        the cave. This is the slow part of setting up the cave, so the
+        grids are memoized on disk.
+    '''
+    dims = (max_depth+1, max_width+1)
+    g = np.full(dims, -1, dtype=np.int32)
+    e = np.full(dims, -1, dtype=np.int32)
+    t = np.full(dims, '.', dtype=np.str_)
+    rx = range(dims[1]); ry = range(dims[0])
+    for i, j in itertools.product(ry, rx):
+        if (i, j) == target or (i, j) == (0, 0):
+            g[i, j] = 0
+        elif i == 0:
+            g[i, j] = j * Cave.y0_factor
+        elif j == 0:
+            g[i, j] = i * Cave.x0_factor
+        else:
+            assert(e[i, j-1] != -1 and e[i-1, j] != -1)
+            g[i, j] = e[i, j-1] * e[i-1, j]
+
+        e[i, j] = (g[i, j] + max_depth) % Cave.errosion_mod
+        m = e[i, j] % 3
+        if m == 1:
+            t[i, j] = '='
+        elif m == 2:
+            t[i, j] = '|'
+    return g, e, t
+
 class Cave:
     x0_factor = 48271
     y0_factor = 16807
@@ -34,62 +62,7 @@ class Cave:
         self.max_width = max_width if max_width is not None else self.target[1]
         self.dims = (self.max_depth+1, self.max_width+1)
         self._tt = None
-
-        # initialize caching
-        os.makedirs(CACHE_DIR, exist_ok=True)
-        self.cachefile_base = os.path.join(CACHE_DIR, hashlib.md5(repr(self).encode('utf-8')).hexdigest())
-
-        if self.cache_exists():
-            print("Using cache for %s." % (repr(self)), file=sys.stderr)
-            self.g = np.load(self.cache_g)
-            self.e = np.load(self.cache_e)
-            self.t = np.load(self.cache_t)
-            return
-
-        # initialize from scratch
-        self.g = np.full(self.dims, -1, dtype=np.int32)
-        self.e = np.full(self.dims, -1, dtype=np.int32)
-        self.t = np.full(self.dims, '.', dtype=np.unicode)
-        rx = range(self.dims[1]); ry = range(self.dims[0])
-        for i, j in itertools.product(ry, rx):
-            if (i, j) == self.target or (i, j) == (0, 0):
-                self.g[i, j] = 0
-            elif i == 0:
-                self.g[i, j] = j * Cave.y0_factor
-            elif j == 0:
-                self.g[i, j] = i * Cave.x0_factor
-            else:
-                assert(self.e[i, j-1] != -1 and self.e[i-1, j] != -1)
-                self.g[i, j] = self.e[i, j-1] * self.e[i-1, j]
-
-            self.e[i, j] = (self.g[i, j] + self.max_depth) % Cave.errosion_mod
-            m = self.e[i, j] % 3
-            if m == 1:
-                self.t[i, j] = '='
-            elif m == 2:
-                self.t[i, j] = '|'
-
-        # write cache files
-        with open(self.cache_info, 'w') as f:
-            print(repr(self), file=f)
-        np.save(self.cache_g, self.g)
-        np.save(self.cache_e, self.e)
-        np.save(self.cache_t, self.t)
-
-    def cache_exists(self):
-        return all(map(os.path.isfile, [self.cache_info, self.cache_g, self.cache_e, self.cache_t]))
-
-    @property
-    def cache_info(self): return '%s_info.txt' % self.cachefile_base
-
-    @property
-    def cache_g(self): return '%s_g.npy' % self.cachefile_base
-
-    @property
-    def cache_e(self): return '%s_e.npy' % self.cachefile_base
-
-    @property
-    def cache_t(self): return '%s_t.npy' % self.cachefile_base
+        self.g, self.e, self.t = cave_grids(self.target, self.max_depth, self.max_width)
 
     def risk(self, tl, br):
         a = self.t[tl[0]:br[0]+1, tl[1]:br[1]+1]
@@ -180,7 +153,7 @@ class Cave:
 
                     csr_row.append(l0); csr_col.append(l1); csr_d.append(1)
 
-        self.ddm = csr_matrix((csr_d, (csr_row, csr_col)), shape=(nlabels, nlabels), dtype=np.uint32)
+        self.ddm = sparse.csr_matrix((csr_d, (csr_row, csr_col)), shape=(nlabels, nlabels), dtype=np.uint32)
 
         # Calculate shortest paths and set object path matrices.
         # If indices argument is None, distances for *all* pairs
@@ -9,6 +9,7 @@ from pprint import pprint
 INPUTS = ['d23-input.txt', 'd23-input-example1.txt', 'd23-input-example2.txt']
 DEBUG = False
 INPUT = INPUTS[2] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 input_re = re.compile(r'pos=<([\d\s,-]+)>,\s*r=(\d+)')
 
@@ -7,6 +7,7 @@ from pprint import pprint
 INPUTS = ['d24-input.txt', 'd24-input-example.txt', 'd24-input-test.txt']
 DEBUG = False
 INPUT = INPUTS[2] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 section_re = re.compile('([\w\s]+):')
 units_re = re.compile(r'(?P<count>\d+) units .* (?P<hp>\d+) hit points( \((?P<resistances>[\w\s,;]+)\))?.* does (?P<dmg>\d+) (?P<dmg_type>\w+) damage .* initiative (?P<initiative>\d+)')
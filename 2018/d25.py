@@ -10,6 +10,7 @@ from pprint import pprint
 INPUTS = ['d25-input.txt', 'd25-input-example1.txt']
 DEBUG = False
 INPUT = INPUTS[1] if DEBUG else INPUTS[0]
+INPUT = sys.argv[1] if len(sys.argv) > 1 else INPUT
 
 # ------------------------------------------------
 # read and label coords
@@ -1,18 +1,128 @@
-"""Boilerplate code for AoC solutions."""
+"""Boilerplate code for AoC solutions.
+
+Run as a module to execute several days in parallel, or to benchmark the
+solutions of all years against a stored baseline:
+
+    python -m aoc run --year 2021 --days 1-13 --jobs 4
+    python -m aoc bench --years 2017 2018 2021 --repeat 5
+
+or to run one day against all its inputs matching a specifier pattern:
+
+    python -m aoc batch --day 12 --spec 'ex*' default gen-x4
+
+Synthetic inputs, scaled up from the real ones, are generated on demand when
+a day is run with a specifier like AOC_INPUTSPEC=gen-x100 (see aocgen.py).
+
+Setting AOC_PROFILE=cpu|mem|lines profiles each part (cProfile, tracemalloc
+or a sampling line profiler) and writes the report under profile/.
+"""
+import functools
+import importlib
+import importlib.util
 import logging
+import mmap
 import os
+import sys
+import time
+import types
+from collections import Counter, OrderedDict, namedtuple
 from pathlib import Path
 
 
+class LazyModule(types.ModuleType):
+    """Placeholder for a module that is imported when one of its attributes is first accessed."""
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """Defer importing a module until it is actually used.
+
+    Meant for modules that are costly to import and only needed on some code
+    paths, e.g. termcolor for debug output. Missing modules are only reported
+    when they are first used.
+    """
+    return sys.modules[name] if name in sys.modules else LazyModule(name)
+
+
+# only needed to generate synthetic inputs
+aocgen = lazy_import('aocgen')
+
+# only needed by cached_parse()
+hashlib = lazy_import('hashlib')
+pickle = lazy_import('pickle')
+
+# only needed by the command line interface and the profilers
+argparse = lazy_import('argparse')
+fnmatch = lazy_import('fnmatch')
+inspect = lazy_import('inspect')
+json = lazy_import('json')
+linecache = lazy_import('linecache')
+multiprocessing = lazy_import('multiprocessing')
+platform = lazy_import('platform')
+re = lazy_import('re')
+resource = lazy_import('resource')
+signal = lazy_import('signal')
+statistics = lazy_import('statistics')
+subprocess = lazy_import('subprocess')
+
+CACHE_DIR = Path(__file__).parent / 'cache'
+CACHE_MAXBYTES_DEFAULT = 256 * 2**20
+CACHE_SUFFIXES = ('.npy', '.pkl')
+BENCH_BASELINE_DEFAULT = Path(__file__).parent / 'bench-baseline.json'
+GEN_SPECIFIER_RE = r'gen-x(?P<scale>\d+)(?:-s(?P<seed>\d+))?'
+PROFILE_DIR = Path(__file__).parent / 'profile'
+PROFILE_TOP = 25
+PROFILE_INTERVAL_DEFAULT = 0.001
+
+
 def input_file(day, specifier=None):
     input_dir = Path(__file__).parent / 'input'
     specifier = specifier if specifier is not None else os.environ.get('AOC_INPUTSPEC', None)
     if specifier is not None:
-        return input_dir / f'input{day:02d}.{specifier}.txt'
+        path = input_dir / f'input{day:02d}.{specifier}.txt'
+        if not path.exists() and (m := re.fullmatch(GEN_SPECIFIER_RE, specifier)):
+            generate(day, int(m['scale']), int(m['seed'] or 0))
+        return path
     else:
         return input_dir / f'input{day:02d}.txt'
 
 
+def input_specifiers(day, patterns=('*',), input_dir=None):
+    """Return the specifiers of the inputs of a day matching any of the glob patterns.
+
+    The real input matches as 'default' and is returned as None. Patterns without
+    wildcards are returned as is even when there is no such input, so that synthetic
+    inputs like gen-x100 are generated on demand. The inputs are looked up in
+    input_dir, input/ next to this module by default.
+    """
+    input_dir = input_dir if input_dir is not None else Path(__file__).parent / 'input'
+    available = ['default'] + sorted(f.name.removeprefix(f'input{day:02d}.').removesuffix('.txt')
+                                     for f in input_dir.glob(f'input{day:02d}.*.txt'))
+    specifiers = []
+    for pattern in patterns:
+        matches = fnmatch.filter(available, pattern) if any(c in pattern for c in '*?[') else [pattern]
+        specifiers.extend(m for m in matches if m not in specifiers)
+    return [None if m == 'default' else m for m in specifiers]
+
+
+def generate(day, scale, seed=0):
+    """Write a synthetic input for a day, scale times the size of the real one, and return its path.
+
+    The input is written in input/ with specifier gen-x<scale> (gen-x<scale>-s<seed> for
+    non-zero seeds), so it can be selected through AOC_INPUTSPEC.
+    """
+    specifier = f'gen-x{scale}' if seed == 0 else f'gen-x{scale}-s{seed}'
+    path = Path(__file__).parent / 'input' / f'input{day:02d}.{specifier}.txt'
+    logging.info(f'Generating {path.name}.')
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp.write_text(aocgen.generate(day, scale, seed))
+    tmp.replace(path)
+    return path
+
+
 def input_lines(day, specifier=None, keepends=False):
     return input_file(day, specifier).read_text().splitlines(keepends=keepends)
 
@@ -30,6 +140,273 @@ def input_enum(day, specifier=None, striplines=True, start=0):
             yield n, line
 
 
+def input_buffer(day, specifier=None):
+    """Memory-map the input file and return a read-only memoryview over its bytes.
+
+    The file is mapped rather than read, so slicing the returned view does not
+    copy any data. The mapping is released when the last view referencing it
+    is garbage collected.
+    """
+    with input_file(day, specifier).open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses to map empty files
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def input_buffer_lines(day, specifier=None, keepends=False):
+    """Iterate over the lines of the input file as memoryview slices of the mapped buffer."""
+    buf = input_buffer(day, specifier)
+    raw = buf.obj  # the mmap (or bytes) object, used for its find() method
+    start = 0
+    while start < len(buf):
+        end = raw.find(b'\n', start)
+        end = end + 1 if end != -1 else len(buf)
+        if keepends or buf[end - 1] != ord('\n'):
+            yield buf[start:end]
+        else:
+            yield buf[start:end - 1]
+        start = end
+
+
+def input_array(day, specifier=None, dtype=int, delimiter=None):
+    """Parse the input file into a NumPy array without copying it as a whole.
+
+    If delimiter is 1, each line is treated as a row of single-digit fields,
+    like np.genfromtxt(..., delimiter=1). The rows are a strided view over the
+    mapped buffer, so no per-line copies are made. With dtype=None the raw
+    ASCII character grid is returned as a read-only uint8 view.
+
+    Otherwise the input is parsed as a flat sequence of numbers separated by
+    delimiter (any whitespace if None). np.fromstring() only parses bytes, so
+    this reads the input in blocks with iter_chunks(), copying one block at a
+    time rather than the whole buffer.
+    """
+    import numpy as np
+
+    if delimiter == 1:
+        buf = input_buffer(day, specifier)
+        raw = np.frombuffer(buf, dtype=np.uint8)
+        if raw.size == 0:
+            return np.empty((0, 0), dtype=dtype if dtype is not None else np.uint8)
+        width = buf.obj.find(b'\n')
+        width = width if width != -1 else raw.size
+        stride = width + 1
+        size = raw.size if raw[-1] == ord('\n') else raw.size + 1  # as if newline-terminated
+        nrows = size // stride
+        if nrows * stride != size:
+            raise ValueError(f"Input for day {day} is not a rectangular grid of width {width}.")
+        grid = np.lib.stride_tricks.as_strided(raw, shape=(nrows, width), strides=(stride, 1), writeable=False)
+        if dtype is None:
+            return grid
+        return np.subtract(grid, ord('0'), dtype=dtype)
+    elif isinstance(delimiter, int):
+        raise ValueError(f"Unsupported field width: {delimiter}")
+    else:
+        chunks = list(iter_chunks(day, specifier, dtype=dtype, sep=delimiter, chunk_size=2**20))
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+
+
+def iter_chunks(day, specifier=None, dtype=int, sep=None, chunk_size=2**16):
+    """Parse the input file as a flat sequence of numbers and yield them as NumPy arrays of chunk_size.
+
+    The last chunk may be shorter. The file is read and parsed in blocks, so memory use is
+    bounded by chunk_size rather than by the size of the input. sep separates the numbers
+    (any whitespace if None), like the delimiter of input_array().
+    """
+    import numpy as np
+
+    separators = b' \t\r\n' + (sep.encode() if sep is not None else b'')
+    tail, rest = b'', np.empty(0, dtype=dtype)
+    with input_file(day, specifier).open('rb') as f:
+        while True:
+            block = f.read(chunk_size * 8)
+            data = tail + block
+            if block:
+                # the number at the end of the block may continue in the next one
+                cut = max(data.rfind(c) for c in separators)
+                if cut == -1:
+                    tail = data
+                    continue
+                data, tail = data[:cut], data[cut + 1:]
+            numbers = np.fromstring(data.strip(separators), dtype=dtype, sep=sep if sep is not None else ' ')
+            rest = np.concatenate([rest, numbers])
+            while rest.size >= chunk_size:
+                yield rest[:chunk_size]
+                rest = rest[chunk_size:]
+            if not block:
+                break
+    if rest.size > 0:
+        yield rest
+
+
+def cache_evict(cache_dir=CACHE_DIR, max_bytes=None, pattern='*'):
+    """Remove the least recently used cache entries matching pattern until they fit in max_bytes.
+
+    Only committed entries (.npy and .pkl files) are considered: the .tmp files being written
+    by other processes are left alone, and so are entries another process removes meanwhile.
+    """
+    max_bytes = max_bytes if max_bytes is not None else cache_maxbytes()
+    entries = []
+    for f in cache_dir.glob(pattern):
+        if f.suffix not in CACHE_SUFFIXES:
+            continue
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, f))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, f in entries:
+        if total <= max_bytes:
+            break
+        logging.debug(f'Evicting cache entry {f.name} ({size} bytes).')
+        f.unlink(missing_ok=True)
+        total -= size
+
+
+def cache_maxbytes():
+    return int(os.environ.get('AOC_CACHE_MAXBYTES', CACHE_MAXBYTES_DEFAULT))
+
+
+def code_version(func):
+    """Return the source of a function, used to invalidate cache entries when it is edited."""
+    try:
+        return inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        return func.__code__.co_code
+
+
+def cache_load(cache_base):
+    """Return (True, value) for the entry stored at cache_base (.npy or .pkl), or (False, None)."""
+    for cache_file in (cache_base.with_suffix('.npy'), cache_base.with_suffix('.pkl')):
+        if not cache_file.is_file():
+            continue
+        logging.debug(f'Using cache entry {cache_file.name}.')
+        os.utime(cache_file)  # mark as recently used
+        if cache_file.suffix == '.npy':
+            import numpy as np
+            return True, np.load(cache_file, allow_pickle=False)
+        with cache_file.open('rb') as f:
+            return True, pickle.load(f)
+    return False, None
+
+
+def cache_store(cache_base, value):
+    """Store a cache entry at cache_base, as .npy for NumPy arrays and pickled otherwise."""
+    # if the value is an ndarray, numpy has necessarily been imported
+    np = sys.modules.get('numpy')
+    is_array = np is not None and isinstance(value, np.ndarray) and not value.dtype.hasobject
+    cache_file = cache_base.with_suffix('.npy' if is_array else '.pkl')
+    cache_tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    cache_base.parent.mkdir(exist_ok=True)
+    try:
+        with cache_tmp.open('wb') as f:
+            if is_array:
+                np.save(f, value, allow_pickle=False)
+            else:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        cache_tmp.replace(cache_file)
+    finally:
+        # left over if the value could not be written
+        cache_tmp.unlink(missing_ok=True)
+
+
+def cached_parse(day, specifier, parser, version=None):
+    """Return parser(specifier), reusing a result cached on disk if available.
+
+    Cache entries are stored in cache/ next to input/, keyed by the SHA-256 of
+    the input file and the parser's name and version. The version defaults to
+    a hash of the parser's source, so editing the parser invalidates its old
+    entries. Pass an explicit version if the parser depends on other code.
+
+    NumPy arrays are stored as .npy files, anything else is pickled. The cache
+    size is bounded by AOC_CACHE_MAXBYTES, evicting least recently used entries.
+    Setting AOC_CACHE_MAXBYTES=0 disables caching.
+    """
+    max_bytes = cache_maxbytes()
+    if max_bytes <= 0:
+        return parser(specifier)
+
+    version = version if version is not None else code_version(parser)
+    key = hashlib.sha256(input_buffer(day, specifier))
+    key.update(f'{parser.__module__}.{parser.__qualname__}'.encode())
+    key.update(version if isinstance(version, bytes) else str(version).encode())
+    cache_base = CACHE_DIR / f'day{day:02d}-{key.hexdigest()}'
+
+    found, parsed = cache_load(cache_base)
+    if found:
+        return parsed
+    parsed = parser(specifier)
+    cache_store(cache_base, parsed)
+    cache_evict(max_bytes=max_bytes)
+    return parsed
+
+
+def memoize(disk=False, max_entries=128, max_bytes=None, version=None, cache_dir=None):
+    """Decorator caching the results of a pure function, in process and optionally on disk.
+
+    Results are keyed by a SHA-256 of the pickled arguments, so arguments need not be
+    hashable (NumPy arrays are fine), but they must be picklable. In process, the
+    max_entries most recently used results are kept.
+
+    With disk=True, results are also stored in cache/ like cached_parse() entries, keyed
+    by the arguments and the function's version (its source by default), and shared by
+    all runs and worker processes. The entries of the function are bounded by max_bytes,
+    and the whole cache by AOC_CACHE_MAXBYTES; AOC_CACHE_MAXBYTES=0 disables the disk tier.
+    The cache is cache_dir, cache/ next to this module by default; the other years pass
+    their own.
+    """
+    cache_dir = cache_dir if cache_dir is not None else CACHE_DIR
+
+    def decorator(func):
+        # module names are not unique: the days all run as __main__
+        name = f'{Path(func.__code__.co_filename).stem}-{func.__qualname__}'.replace('.', '-')
+        memory = OrderedDict()
+
+        @functools.cache
+        def func_version():
+            v = version if version is not None else code_version(func)
+            return v if isinstance(v, bytes) else str(v).encode()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = hashlib.sha256(pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL))
+            args_key = key.digest()
+            if args_key in memory:
+                memory.move_to_end(args_key)
+                return memory[args_key]
+
+            cache_maxbytes_total = cache_maxbytes() if disk else 0
+            if cache_maxbytes_total > 0:
+                key.update(func_version())
+                cache_base = cache_dir / f'memo-{name}-{key.hexdigest()}'
+                found, result = cache_load(cache_base)
+                if not found:
+                    result = func(*args, **kwargs)
+                    cache_store(cache_base, result)
+                    if max_bytes is not None:
+                        cache_evict(cache_dir, max_bytes=max_bytes, pattern=f'memo-{name}-*')
+                    cache_evict(cache_dir, max_bytes=cache_maxbytes_total)
+            else:
+                result = func(*args, **kwargs)
+
+            memory[args_key] = result
+            if len(memory) > max_entries:
+                memory.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = memory.clear
+        return wrapper
+    return decorator
+
+
+def debug_enabled():
+    """Check if debug logging is on, to skip building expensive debug output otherwise."""
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
 def logging_setup(loglevel_default='WARNING'):
     loglevel = os.environ.get('AOC_LOGLEVEL', loglevel_default).upper()
     logging.basicConfig(level=loglevel)
@@ -41,3 +418,349 @@ def hr(fill='-', width=80, label=None):
     else:
         align = '<'
         return f'---{f" {label} ":{fill}{align}{width-5}}'
+
+
+def profile_mode():
+    mode = os.environ.get('AOC_PROFILE', '').lower() or None
+    if mode is not None and mode not in PROFILERS:
+        raise ValueError(f"Invalid AOC_PROFILE mode '{mode}'. Use one of: {', '.join(PROFILERS)}.")
+    return mode
+
+
+def profile_report_file(label, mode):
+    PROFILE_DIR.mkdir(exist_ok=True)
+    return PROFILE_DIR / f'{label}-{mode}-{time.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}.txt'
+
+
+def profile_cpu(func, *args, **kwargs):
+    import cProfile
+    import io
+    import pstats
+
+    prof = cProfile.Profile()
+    result = prof.runcall(func, *args, **kwargs)
+    report = io.StringIO()
+    stats = pstats.Stats(prof, stream=report)
+    stats.sort_stats('tottime').print_stats(PROFILE_TOP)
+    stats.sort_stats('cumulative').print_stats(PROFILE_TOP)
+    return result, report.getvalue()
+
+
+def profile_mem(func, *args, **kwargs):
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    report = [f'current: {current / 2**20:.1f}MB peak: {peak / 2**20:.1f}MB', '',
+              f'top {PROFILE_TOP} allocations still alive at return:']
+    report.extend(str(stat) for stat in snapshot.statistics('lineno')[:PROFILE_TOP])
+    return result, '\n'.join(report)
+
+
+def profile_lines(func, *args, **kwargs):
+    """Sample the executing line every AOC_PROFILE_INTERVAL seconds of CPU time."""
+    interval = float(os.environ.get('AOC_PROFILE_INTERVAL', PROFILE_INTERVAL_DEFAULT))
+    samples = Counter()
+
+    def sample(signum, frame):
+        samples[(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)] += 1
+
+    handler = signal.signal(signal.SIGPROF, sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, handler)
+
+    nsamples = sum(samples.values())
+    report = [f'{nsamples} samples, {interval * 1000:g}ms interval', '']
+    for (filename, lineno, name), n in samples.most_common(PROFILE_TOP):
+        source = linecache.getline(filename, lineno).strip() if lineno is not None else ''
+        report.append(f'{100 * n / nsamples:6.2f}% {n:7d}  {Path(filename).name}:{lineno} ({name})  {source}')
+    return result, '\n'.join(report)
+
+
+PROFILERS = {'cpu': profile_cpu, 'mem': profile_mem, 'lines': profile_lines}
+
+
+def profiled(func, mode, report_file):
+    """Wrap a part function so that every call is profiled and appended to report_file."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result, report = PROFILERS[mode](func, *args, **kwargs)
+        with report_file.open('a') as f:
+            print(hr(label=func.__qualname__), file=f)
+            print(report, file=f)
+        return result
+    return wrapper
+
+
+def run(*parts, specifier=None):
+    """Entry point for the __main__ block of a day: print the answer of each part.
+
+    If AOC_PROFILE is set, the parts are profiled and a report is written for the run.
+    """
+    logging_setup()
+    mode = profile_mode()
+    if mode is not None:
+        report_file = profile_report_file(Path(sys.argv[0]).stem, mode)
+        parts = [profiled(part, mode, report_file) for part in parts]
+    for part in parts:
+        print(part(specifier))
+    if mode is not None:
+        print(f'Profile report: {report_file}', file=sys.stderr)
+
+
+PartResult = namedtuple('PartResult', ('year', 'day', 'part', 'answer', 'wall', 'cpu', 'maxrss', 'error'))
+
+
+def year_dir(year):
+    return Path(__file__).parent.parent / f'{year}'
+
+
+def import_day(year, day):
+    """Import the module of a day's solution from the directory of the given year."""
+    ydir = year_dir(year)
+    if str(ydir) not in sys.path:
+        sys.path.insert(0, str(ydir))
+    # the day must import the aoc module of its own year, which may not be this one
+    aoc = sys.modules.get('aoc')
+    if aoc is not None and Path(aoc.__file__).parent != ydir:
+        del sys.modules['aoc']
+    name = f'day{day:02d}'
+    spec = importlib.util.spec_from_file_location(name, ydir / f'{name}.py')
+    if spec is None:
+        raise ImportError(f'No solution found for year {year} day {day}.')
+    module = importlib.util.module_from_spec(spec)
+    # registered like a regular import, so that pickle finds the classes of the day
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_part(year, day, part, specifier=None):
+    """Run a single part of a day and measure it. Meant to run in a fresh worker process."""
+    logging_setup()
+    t0, c0 = time.perf_counter(), time.process_time()
+    try:
+        func = getattr(import_day(year, day), f'part{part}')
+        mode = profile_mode()
+        if mode is not None:
+            func = profiled(func, mode, profile_report_file(f'{year}-day{day:02d}.{part}', mode))
+        answer, error = func(specifier), None
+    except Exception as e:
+        answer, error = None, f'{e.__class__.__name__}: {e}'
+    wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # kilobytes on linux
+    return PartResult(year, day, part, answer, wall, cpu, maxrss, error)
+
+
+def run_parallel(tasks, jobs=None):
+    """Run (year, day, part, specifier) tasks in a process pool and return their results in order.
+
+    Each task gets a fresh worker process, so the peak RSS reported for it is its own. Workers
+    are spawned rather than forked: the pool replaces them from a helper thread, and a fork
+    could copy an import lock held by another thread of the parent.
+    """
+    with multiprocessing.get_context('spawn').Pool(processes=jobs, maxtasksperchild=1) as pool:
+        return pool.starmap(run_part, tasks, chunksize=1)
+
+
+def parse_days(spec):
+    """Parse a day range specification like '1-5,7,9-13'."""
+    days = []
+    for r in spec.split(','):
+        first, _, last = r.partition('-')
+        days.extend(range(int(first), int(last if last else first) + 1))
+    return days
+
+
+def format_result(r, label=None):
+    label = label if label is not None else f'{r.year}/{r.day:02d}.{r.part}'
+    stats = f'{label:<16} {r.wall:9.3f}s {r.cpu:9.3f}s {r.maxrss / 2**20:8.1f}MB'
+    if r.error is not None:
+        return f'{stats}  ERROR {r.error}'
+    answer = str(r.answer)
+    if '\n' in answer:
+        # multi-line answers (e.g. ascii art) go below the stats line
+        return '\n'.join([stats] + [f'    {ln}' for ln in answer.splitlines()])
+    return f'{stats}  {answer}'
+
+
+def cmd_run(args):
+    days = parse_days(args.days) if args.days else sorted(
+        int(f.stem.removeprefix('day')) for f in year_dir(args.year).glob('day[0-9][0-9].py'))
+    tasks = [(args.year, day, part, args.spec) for day in days for part in (1, 2)]
+    t0 = time.perf_counter()
+    results = run_parallel(tasks, args.jobs)
+    print(f'{"part":<16} {"wall":>10} {"cpu":>10} {"maxrss":>10}  answer')
+    for r in results:
+        print(format_result(r))
+    print(hr())
+    print(f'{len(results)} parts in {time.perf_counter() - t0:.3f}s')
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+def cmd_batch(args):
+    specifiers = input_specifiers(args.day, args.spec, year_dir(args.year) / 'input')
+    if not specifiers:
+        print(f'No inputs of day {args.day} match {" ".join(args.spec)}.', file=sys.stderr)
+        return 1
+    # the specifiers are explicit, the real input must not be overridden
+    os.environ.pop('AOC_INPUTSPEC', None)
+    tasks = [(args.year, args.day, part, spec) for spec in specifiers for part in (1, 2)]
+    t0 = time.perf_counter()
+    results = run_parallel(tasks, args.jobs)
+    print(f'{f"{args.year}/{args.day:02d} input":<16} {"wall":>10} {"cpu":>10} {"maxrss":>10}  answer')
+    for (_, _, part, spec), r in zip(tasks, results):
+        print(format_result(r, label=f'{spec or "default"}.{part}'))
+    print(hr())
+    print(f'{len(specifiers)} inputs, {len(results)} parts in {time.perf_counter() - t0:.3f}s')
+    return 1 if any(r.error is not None for r in results) else 0
+
+
+BenchCase = namedtuple('BenchCase', ('label', 'cwd', 'argv', 'env'))
+
+
+def bench_cases(year):
+    """Enumerate the scripts of a year, run against their real input and their example inputs."""
+    ydir = year_dir(year)
+    if year == 2018:
+        # dNN.py scripts, optionally taking the input file as their first argument
+        for script in sorted(ydir.glob('d[0-9][0-9].py')):
+            yield BenchCase(f'{year}/{script.stem}', ydir, [script.name], {})
+            for example in sorted(ydir.glob(f'{script.stem}-input-example*.txt')):
+                spec = example.stem.removeprefix(f'{script.stem}-input-')
+                yield BenchCase(f'{year}/{script.stem}:{spec}', ydir, [script.name, example.name], {})
+    else:
+        # dayNN.py scripts (2017 and later), selecting their input through AOC_INPUTSPEC
+        for script in sorted(ydir.glob('day[0-9][0-9].py')):
+            yield BenchCase(f'{year}/{script.stem}', ydir, [script.name], {})
+            day = script.stem.removeprefix('day')
+            for example in sorted((ydir / 'input').glob(f'input{day}.ex*.txt')):
+                spec = example.name.removeprefix(f'input{day}.').removesuffix('.txt')
+                yield BenchCase(f'{year}/{script.stem}:{spec}', ydir, [script.name], {'AOC_INPUTSPEC': spec})
+
+
+def bench_case(case, repeat, timeout):
+    """Run a benchmark case repeatedly in a fresh interpreter and summarize its timings.
+
+    The disk caches are disabled, otherwise every run after the first would time cache hits.
+    """
+    env = {k: v for k, v in os.environ.items() if k != 'AOC_INPUTSPEC'} | case.env | {'AOC_CACHE_MAXBYTES': '0'}
+    walls, cpus = [], []
+    for _ in range(repeat):
+        ru0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        t0 = time.perf_counter()
+        try:
+            p = subprocess.run([sys.executable] + case.argv, cwd=case.cwd, env=env, timeout=timeout,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except subprocess.TimeoutExpired:
+            return {'status': 'timeout'}
+        walls.append(time.perf_counter() - t0)
+        ru1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpus.append((ru1.ru_utime - ru0.ru_utime) + (ru1.ru_stime - ru0.ru_stime))
+        if p.returncode != 0:
+            error = p.stderr.decode(errors='replace').strip().splitlines()
+            return {'status': 'error', 'error': error[-1] if error else f'exit status {p.returncode}'}
+    return {
+        'status': 'ok',
+        'runs': repeat,
+        'wall_min': min(walls),
+        'wall_median': statistics.median(walls),
+        'cpu_min': min(cpus),
+    }
+
+
+def bench_compare(result, baseline, threshold, noise):
+    """Return a description of the regression of result against baseline, or None."""
+    if baseline is None or baseline['status'] != 'ok':
+        return None
+    if result['status'] != 'ok':
+        return f'{result["status"]} (was ok)'
+    ratio = result['wall_median'] / baseline['wall_median']
+    if ratio > threshold and result['wall_median'] - baseline['wall_median'] > noise:
+        return f'{baseline["wall_median"]:.3f}s -> {result["wall_median"]:.3f}s ({ratio:.2f}x)'
+    return None
+
+
+def cmd_bench(args):
+    baseline_file = Path(args.baseline)
+    baseline = json.loads(baseline_file.read_text())['cases'] if baseline_file.exists() else {}
+    label_re = re.compile(args.filter) if args.filter else None
+
+    results, regressions = {}, []
+    print(f'{"case":<24} {"median":>10} {"min":>10} {"cpu":>10} {"baseline":>10}')
+    for year in args.years:
+        for case in bench_cases(year):
+            if label_re is not None and not label_re.search(case.label):
+                continue
+            r = results[case.label] = bench_case(case, args.repeat, args.timeout)
+            b = baseline.get(case.label)
+            bstr = f'{b["wall_median"]:9.3f}s' if b is not None and b['status'] == 'ok' else f'{"-":>10}'
+            if r['status'] == 'ok':
+                line = f'{case.label:<24} {r["wall_median"]:9.3f}s {r["wall_min"]:9.3f}s {r["cpu_min"]:9.3f}s {bstr}'
+            else:
+                line = f'{case.label:<24} {r["status"].upper():>10} {r.get("error", "")}'
+            regression = bench_compare(r, b, args.threshold, args.noise)
+            if regression is not None:
+                regressions.append((case.label, regression))
+                line += f'  REGRESSION {regression}'
+            print(line, flush=True)
+
+    if args.update:
+        baseline_file.write_text(json.dumps({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cases': baseline | results,
+        }, indent=2, sort_keys=True) + '\n')
+        print(f'Baseline updated: {baseline_file}')
+
+    print(hr())
+    print(f'{len(results)} cases, {len(regressions)} regressions (threshold {args.threshold:.2f}x)')
+    return 1 if regressions and not args.update else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aoc', description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p = subparsers.add_parser('run', help='run the parts of several days in parallel')
+    p.add_argument('--year', type=int, default=2021)
+    p.add_argument('--days', help='days to run, e.g. 1-5,7 (default: all)')
+    p.add_argument('--jobs', '-j', type=int, default=None, help='worker processes (default: number of cpus)')
+    p.add_argument('--spec', default=None, help='input specifier, like AOC_INPUTSPEC')
+    p.set_defaults(func=cmd_run)
+
+    p = subparsers.add_parser('batch', help='run one day against several of its inputs in parallel')
+    p.add_argument('--year', type=int, default=2021)
+    p.add_argument('--day', type=int, required=True)
+    p.add_argument('--spec', nargs='+', default=['*'],
+                   help="input specifier glob patterns, 'default' is the real input (default: all inputs)")
+    p.add_argument('--jobs', '-j', type=int, default=None, help='worker processes (default: number of cpus)')
+    p.set_defaults(func=cmd_batch)
+
+    p = subparsers.add_parser('bench', help='benchmark solutions and check them against a baseline')
+    p.add_argument('--years', type=int, nargs='+', default=[2017, 2018, 2021])
+    p.add_argument('--filter', help='only run cases with labels matching this regex, e.g. 2021/day0[1-5]')
+    p.add_argument('--repeat', '-r', type=int, default=5, help='timed runs per case')
+    p.add_argument('--timeout', type=float, default=600, help='timeout per run, in seconds')
+    p.add_argument('--baseline', default=BENCH_BASELINE_DEFAULT, help='baseline json file')
+    p.add_argument('--threshold', type=float, default=1.25, help='median slowdown ratio considered a regression')
+    p.add_argument('--noise', type=float, default=0.05, help='slowdowns below this many seconds are ignored')
+    p.add_argument('--update', action='store_true', help='store the results as the new baseline')
+    p.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""Synthetic input generators for the 2021 solutions.
+
+Each generator produces a valid input for its day, roughly `scale` times the
+size of the real puzzle input. Use them through aoc.generate() or with an
+AOC_INPUTSPEC like gen-x100 (or gen-x100-s7 to pick a different seed).
+"""
+import logging
+import math
+
+import numpy as np
+
+# segments lit for each digit, as in the puzzle description
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+PAIRS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+def lines(rows):
+    return '\n'.join(rows) + '\n'
+
+
+def gen_day01(rng, scale):
+    # a random walk of depth readings, mostly going down
+    n = 2000 * scale
+    return lines(map(str, np.abs(150 + np.cumsum(rng.integers(-10, 30, n))).tolist()))
+
+
+def gen_day02(rng, scale):
+    n = 1000 * scale
+    # more down than up, so that the submarine stays below the surface
+    instrs = rng.choice(['forward', 'down', 'up'], n, p=[0.4, 0.35, 0.25])
+    return lines(f'{i} {d}' for i, d in zip(instrs.tolist(), rng.integers(1, 10, n).tolist()))
+
+
+def gen_day03(rng, scale):
+    # grow both dimensions, columns are needed anyway to keep the lines unique
+    n = round(1000 * math.sqrt(scale))
+    ncolumns = max(12, round(12 * math.sqrt(scale)), n.bit_length() + 1)
+    bits = np.unique(rng.integers(0, 2, (n, ncolumns), dtype=np.uint8), axis=0)
+    while bits.shape[0] < n:
+        # the rating filters need unique lines to end with a single one
+        more = rng.integers(0, 2, (n - bits.shape[0], ncolumns), dtype=np.uint8)
+        bits = np.unique(np.vstack([bits, more]), axis=0)
+    bits = rng.permutation(bits) + ord('0')
+    return lines(row.tobytes().decode() for row in bits)
+
+
+def gen_day04(rng, scale):
+    # every board is drawn from the called numbers, so every board wins eventually
+    numbers = rng.permutation(100)
+    nboards = 100 * scale
+    boards = [rng.choice(100, 25, replace=False).reshape(5, 5) for _ in range(nboards)]
+    boards = ['\n'.join(' '.join(f'{n:2d}' for n in row) for row in b) for b in boards]
+    return ','.join(map(str, numbers)) + '\n\n' + '\n\n'.join(boards) + '\n'
+
+
+def gen_day05(rng, scale):
+    # lines are 1/3 horizontal, 1/3 vertical and 1/3 diagonal
+    n, side = 500 * scale, round(1000 * math.sqrt(scale))
+    x0, y0 = rng.integers(0, side, n), rng.integers(0, side, n)
+    x1, y1 = rng.integers(0, side, n), rng.integers(0, side, n)
+    kind = rng.integers(0, 3, n)
+    y1 = np.where(kind == 0, y0, y1)
+    x1 = np.where(kind == 1, x0, x1)
+    # diagonals: clip the length so that the line stays in the grid
+    d = np.minimum(np.abs(x1 - x0), np.abs(y1 - y0))
+    x1 = np.where(kind == 2, x0 + np.sign(x1 - x0) * d, x1)
+    y1 = np.where(kind == 2, y0 + np.sign(y1 - y0) * d, y1)
+    return lines(f'{a},{b} -> {c},{d}' for a, b, c, d in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()))
+
+
+def gen_day06(rng, scale):
+    return ','.join(map(str, rng.integers(1, 6, 300 * scale).tolist())) + '\n'
+
+
+def gen_day07(rng, scale):
+    # crabs cluster towards low positions, like in the real input
+    positions = np.minimum(rng.geometric(1 / 450, 1000 * scale) - 1, 1999)
+    return ','.join(map(str, positions.tolist())) + '\n'
+
+
+def gen_day08(rng, scale):
+    entries = []
+    for _ in range(200 * scale):
+        wiring = dict(zip('abcdefg', rng.permutation(list('abcdefg'))))
+        scramble = lambda digit: ''.join(rng.permutation([wiring[s] for s in SEGMENTS[digit]]))
+        signals = [scramble(d) for d in rng.permutation(10)]
+        output = [scramble(d) for d in rng.integers(0, 10, 4)]
+        entries.append(f'{" ".join(signals)} | {" ".join(output)}')
+    return lines(entries)
+
+
+def gen_day09(rng, scale):
+    # Uniformly random heights make one huge basin with thousands of low points.
+    # Like in the real input, make basins of cells around a single low point instead,
+    # one per block of the map, walled off by 9s: the height of a cell is its distance
+    # to the nearest low point, and cells next to another basin are walls.
+    side, block = round(100 * math.sqrt(scale)), 7
+    nblocks = -(-side // block)
+    # low points are kept 3 cells apart, so that they are never part of a wall
+    corners = np.indices((nblocks, nblocks)).transpose(1, 2, 0) * block
+    low_points = corners + rng.integers(1, block - 1, (nblocks, nblocks, 2))
+    i, j = np.indices((side, side))
+    bi, bj = i // block, j // block
+    best_distance = np.full((side, side), np.iinfo(np.int64).max)
+    basin = np.zeros((side, side), dtype=np.int64)
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            ni, nj = np.clip(bi + di, 0, nblocks - 1), np.clip(bj + dj, 0, nblocks - 1)
+            li, lj = low_points[ni, nj].transpose(2, 0, 1)
+            distance = np.abs(i - li) + np.abs(j - lj)
+            closer = distance < best_distance
+            best_distance[closer], basin[closer] = distance[closer], (ni * nblocks + nj)[closer]
+    p = np.pad(basin, 1, mode='edge')
+    wall = (p[:-2, 1:-1] != basin) | (p[2:, 1:-1] != basin) | (p[1:-1, :-2] != basin) | (p[1:-1, 2:] != basin)
+    heights = np.where(wall, 9, np.minimum(best_distance, 8)).astype(np.uint8) + ord('0')
+    return lines(row.tobytes().decode() for row in heights)
+
+
+def gen_day10(rng, scale):
+    # Corrupted lines close a chunk with the wrong character, the rest are
+    # incomplete. Closing characters are only emitted when a chunk is open,
+    # like the checker expects.
+    opening = list(PAIRS)
+    result = []
+    for _ in range(100 * scale):
+        length, corrupt_at = rng.integers(80, 110), rng.integers(0, 200)
+        stack, line = [], []
+        for i in range(length):
+            if stack and rng.random() < 0.45:
+                if i >= corrupt_at:
+                    wrong = [c for c in PAIRS.values() if c != PAIRS[stack[-1]]]
+                    line.append(wrong[rng.integers(0, len(wrong))])
+                    corrupt_at = length
+                else:
+                    line.append(PAIRS[stack.pop()])
+            else:
+                stack.append(opening[rng.integers(0, len(opening))])
+                line.append(stack[-1])
+        result.append(''.join(line))
+    return lines(result)
+
+
+def octopus_sync_step(data, maxsteps):
+    """Return the first step on which all octopuses flash, or None if that does not happen within maxsteps."""
+    data = data.astype(np.int64)
+    for step in range(1, maxsteps + 1):
+        data += 1
+        flashed = np.zeros(data.shape, dtype=bool)
+        while True:
+            flashed_new = (data > 9) & ~flashed
+            if not flashed_new.any():
+                break
+            flashed |= flashed_new
+            p = np.pad(flashed_new, 1).astype(np.int64)
+            neighbours = [p[:-2, :-2], p[:-2, 1:-1], p[:-2, 2:], p[1:-1, :-2],
+                          p[1:-1, 2:], p[2:, :-2], p[2:, 1:-1], p[2:, 2:]]
+            data += sum(neighbours)
+        if flashed.all():
+            return step
+        data[flashed] = 0
+    return None
+
+
+def gen_day11(rng, scale):
+    # Random grids of energies 0-8 practically never synchronize once they are
+    # larger than the puzzle grid, and part 2 would loop forever. Energies of
+    # 0-5 synchronize within a few dozen steps; check it to be sure.
+    side = round(10 * math.sqrt(scale))
+    for attempt in range(100):
+        energies = rng.integers(0, 6, (side, side), dtype=np.uint8)
+        if octopus_sync_step(energies, 1000) is not None:
+            break
+        logging.debug(f'Generated day 11 grid does not synchronize, retrying ({attempt}).')
+    else:
+        raise RuntimeError('Could not generate a synchronizing day 11 grid.')
+    return lines((row + ord('0')).tobytes().decode() for row in energies)
+
+
+def gen_day12(rng, scale):
+    # The number of paths grows exponentially with the number of caves, so
+    # the cave count only grows with the log of the scale.
+    extra = int(math.log2(scale))
+    nsmall, nbig = 5 + extra, 2 + extra // 3
+    names = [chr(97 + i // 26) + chr(97 + i % 26) for i in rng.choice(26 * 26, nsmall + nbig, replace=False)]
+    small, big = names[:nsmall], [name.upper() for name in names[nsmall:]]
+
+    # a path from start to end through all small caves, so that end is reachable
+    route = ['start'] + rng.permutation(small).tolist() + ['end']
+    edges = {tuple(sorted(e)) for e in zip(route, route[1:])}
+    # big caves are only connected to small caves, otherwise there would be infinitely many paths
+    for a in small + big:
+        for b in small:
+            if a != b and rng.random() < 0.3:
+                edges.add(tuple(sorted((a, b))))
+    for a in big:
+        edges.add(tuple(sorted((a, small[rng.integers(0, nsmall)]))))
+    return lines(f'{a}-{b}' if rng.random() < 0.5 else f'{b}-{a}' for a, b in sorted(edges))
+
+
+def gen_day13(rng, scale):
+    # Start from the folded paper and unfold it, mirroring each dot at random.
+    # Fold lines are at (final + 1) * 2^k - 1, so every fold is exactly in the
+    # middle of the paper like in the puzzle. Each doubling of the scale adds a fold.
+    final_x, final_y = 40, 6
+    extra = round(math.log2(scale))
+    folds_x, folds_y = 5 + extra // 2, 7 + extra - extra // 2
+    fold_lines_x = [(final_x + 1) * 2**k - 1 for k in range(folds_x - 1, -1, -1)]
+    fold_lines_y = [(final_y + 1) * 2**k - 1 for k in range(folds_y - 1, -1, -1)]
+
+    # the folded paper shows a random pattern
+    code = np.argwhere(rng.random((final_x, final_y)) < 0.35)
+    ndots = 900 * scale
+    x, y = code[rng.integers(0, len(code), ndots)].T
+    for fold_lines, coords in ((fold_lines_x, x), (fold_lines_y, y)):
+        for n in reversed(fold_lines):
+            mirror = rng.random(ndots) < 0.5
+            coords[mirror] = 2 * n - coords[mirror]
+    # make sure the paper has its full size: the mirror of the origin across the first folds
+    x = np.append(x, [2 * fold_lines_x[0], 0])
+    y = np.append(y, [0, 2 * fold_lines_y[0]])
+
+    folds = []
+    for i in range(max(folds_x, folds_y)):
+        if i < folds_x:
+            folds.append(f'fold along x={fold_lines_x[i]}')
+        if i < folds_y:
+            folds.append(f'fold along y={fold_lines_y[i]}')
+    dots = sorted(set(zip(x.tolist(), y.tolist())), key=lambda _: rng.random())
+    return lines(f'{a},{b}' for a, b in dots) + '\n' + lines(folds)
+
+
+GENERATORS = {
+    day: globals()[f'gen_day{day:02d}'] for day in range(1, 14)
+}
+
+
+def generate(day, scale, seed=0):
+    """Return the text of a synthetic input for a day."""
+    if day not in GENERATORS:
+        raise ValueError(f'No input generator for day {day}.')
+    if scale < 1:
+        raise ValueError(f'Invalid scale {scale}, it must be at least 1.')
+    rng = np.random.default_rng([day, seed])
+    return GENERATORS[day](rng, scale)
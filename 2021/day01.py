@@ -1,25 +1,29 @@
 #!/usr/bin/env python3.10
 
-from collections import deque
-from itertools import islice, pairwise
+import numpy as np
 
 import aoc
 
 
-def sliding_window(iterable, n):
-    # sliding_window('ABCDEFG', 4) -> ABCD BCDE CDEF DEFG
-    it = iter(iterable)
-    window = deque(islice(it, n), maxlen=n)
-    if len(window) == n:
-        yield tuple(window)
-    for x in it:
-        window.append(x)
-        yield tuple(window)
+def count_increases(specifier, lag):
+    # Comparing windows of `lag` readings boils down to comparing the readings
+    # `lag` apart, as the rest of the windows is shared. The last readings of a
+    # chunk are carried over to be compared with the next chunk.
+    count, carry = 0, np.empty(0, dtype=int)
+    for chunk in aoc.iter_chunks(1, specifier, dtype=int):
+        depths = np.concatenate([carry, chunk])
+        count += np.count_nonzero(depths[lag:] > depths[:-lag])
+        carry = depths[-lag:]
+    return count
 
 
-if __name__ == '__main__':
-    # first part
-    print(sum([b > a for a, b in pairwise(map(int, aoc.input_lines(1)))]))
+def part1(specifier=None):
+    return count_increases(specifier, 1)
+
+
+def part2(specifier=None):
+    return count_increases(specifier, 3)
 
-    # second part
-    print(sum([sum(b) > sum(a) for a, b in pairwise(sliding_window(map(int, aoc.input_lines(1)), 3))]))
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
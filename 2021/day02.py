@@ -45,11 +45,15 @@ def reduce_f2(coords, instruction_line):
     return coords
 
 
-if __name__ == '__main__':
-    # first part
-    end_coords = reduce(reduce_f1, aoc.input_lines(2), [0, 0])
-    print(end_coords[0] * end_coords[1])
+def part1(specifier=None):
+    end_coords = reduce(reduce_f1, aoc.input_lines(2, specifier), [0, 0])
+    return end_coords[0] * end_coords[1]
+
+
+def part2(specifier=None):
+    end_coords = reduce(reduce_f2, aoc.input_lines(2, specifier), [0, 0, 0])
+    return end_coords[0] * end_coords[1]
 
-    # second part
-    end_coords = reduce(reduce_f2, aoc.input_lines(2), [0, 0, 0])
-    print(end_coords[0] * end_coords[1])
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
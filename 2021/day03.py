@@ -1,48 +1,46 @@
 #!/usr/bin/env python3.10
 
-from collections import Counter
-from functools import reduce
-from itertools import islice
-
 import aoc
 
-if __name__ == '__main__':
-    lines = aoc.input_lines(3)
-    ncolumns = len(lines[0])
-
-    # first part
-    columns = list(zip(*lines))
-    gamma_rate_bits = [Counter(c).most_common()[0][0] for c in columns]
-    epsilon_rate_bits = [Counter(c).most_common()[-1][0] for c in columns]
-    bits2int = lambda ba: int(''.join(ba), base=2)
-    print(bits2int(gamma_rate_bits) * bits2int(epsilon_rate_bits))
-
-    # second part
-    o2_lines, o2_rating = list(lines), None
-    for i in range(ncolumns):
-        columns = list(zip(*o2_lines))
-        bitcounts = Counter(columns[i])
-        filter_bit = max(bitcounts.items(), key=lambda t: (t[1], t[0]))[0]
-        o2_lines = list(filter(lambda l: l[i] == filter_bit, o2_lines))
-        if len(o2_lines) == 1:
-            o2_rating = int(o2_lines[0], base=2)
-            break
+# Convert an array of bits to an int. Works for any number of columns.
+bits2int = lambda bits: int(''.join(bits.astype(int).astype(str)), base=2)
+
+
+def filter_rating(bits, most_common):
+    rows = bits
+    for i in range(bits.shape[1]):
+        nones = rows[:, i].sum()
+        nzeros = rows.shape[0] - nones
+        if most_common:
+            filter_bit = 1 if nones >= nzeros else 0
+        else:
+            filter_bit = 0 if nzeros and (nzeros <= nones or not nones) else 1
+        rows = rows[rows[:, i] == filter_bit]
+        if rows.shape[0] == 1:
+            return bits2int(rows[0])
+    return None
+
+
+def part1(specifier=None):
+    # grid of bits, parsed straight from the mapped input
+    bits = aoc.input_array(3, specifier, dtype=int, delimiter=1)
+    gamma_rate_bits = bits.sum(axis=0) * 2 > bits.shape[0]
+    epsilon_rate_bits = ~gamma_rate_bits
+    return bits2int(gamma_rate_bits) * bits2int(epsilon_rate_bits)
+
+
+def part2(specifier=None):
+    bits = aoc.input_array(3, specifier, dtype=int, delimiter=1)
+    o2_rating = filter_rating(bits, most_common=True)
     if o2_rating is None:
         raise RuntimeError("Could not determine O2 rating.")
 
-    co2_lines, co2_rating = list(lines), None
-    for i in range(ncolumns):
-        columns = list(zip(*co2_lines))
-        bitcounts = Counter(columns[i])
-        filter_bit = min(bitcounts.items(), key=lambda t: (t[1], t[0]))[0]
-        co2_lines = list(filter(lambda l: l[i] == filter_bit, co2_lines))
-        if len(co2_lines) == 1:
-            co2_rating = int(co2_lines[0], base=2)
-            break
+    co2_rating = filter_rating(bits, most_common=False)
     if co2_rating is None:
         raise RuntimeError("Could not determine CO2 rating.")
 
-    print(o2_rating * co2_rating)
-   
-        
+    return o2_rating * co2_rating
 
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
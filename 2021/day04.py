@@ -1,5 +1,7 @@
 #!/usr/bin/env python3.10
 
+from functools import cache
+
 import numpy as np
 
 import aoc
@@ -23,8 +25,9 @@ def parse_input(specifier=None):
     return (bingo_numbers, bingo_boards)
 
 
-if __name__ == '__main__':
-    bingo_numbers, bingo_boards = parse_input()
+@cache
+def play(specifier=None):
+    bingo_numbers, bingo_boards = aoc.cached_parse(4, specifier, parse_input)
     bingo_found = [np.zeros(shape=b.shape, dtype=int) for b in bingo_boards]
     winners = {}
     for idxn, n in enumerate(bingo_numbers):
@@ -39,11 +42,18 @@ if __name__ == '__main__':
     else:
         raise ValueError(f"Only {len(winners)}/{len(bingo_boards)} were able to "
                          f"score a bingo with numbers {bingo_numbers}.")
+    return winners
+
+
+def part1(specifier=None):
+    idxb, ((b, bf), (idxn, n)) = min(play(specifier).items(), key=lambda kv: kv[1][1][0])
+    return np.sum(b[bf == 0]) * n
 
-    # first part
-    idxb, ((b, bf), (idxn, n)) = min(winners.items(), key=lambda kv: kv[1][1][0])
-    print(np.sum(b[bf == 0]) * n)
 
-    # second part
-    idxb, ((b, bf), (idxn, n)) = max(winners.items(), key=lambda kv: kv[1][1][0])
-    print(np.sum(b[bf == 0]) * n)
+def part2(specifier=None):
+    idxb, ((b, bf), (idxn, n)) = max(play(specifier).items(), key=lambda kv: kv[1][1][0])
+    return np.sum(b[bf == 0]) * n
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
@@ -56,14 +56,19 @@ def parse_input(specifier=None, only_hv=True):
             # add increment array to scanmap
             x, y = min(x0, x1), min(y0, y1)
             scanmap[x:x + a.shape[0], y:y + a.shape[1]] += a
-        logging.debug(f'Scanmap after line {n}:\n{scanmap}\n')
+        if aoc.debug_enabled():
+            logging.debug(f'Scanmap after line {n}:\n{scanmap}\n')
 
     return scanmap
 
 
-if __name__ == '__main__':
-    # first part
-    print(np.sum(parse_input() > 1))
+def part1(specifier=None):
+    return np.sum(parse_input(specifier) > 1)
+
+
+def part2(specifier=None):
+    return np.sum(parse_input(specifier, only_hv=False) > 1)
 
-    # second part
-    print(np.sum(parse_input(only_hv=False) > 1))
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
@@ -1,32 +1,43 @@
 #!/usr/bin/env python3.10
 
-from collections import Counter
+import numpy as np
 
 import aoc
 
 
-def part1(line):
-    crabs = sorted([(pos, count) for pos, count in Counter(map(lambda s: int(s.strip()), line.split(','))).items()])
-    fsum1 = lambda x: sum([count * abs(pos - x) for pos, count in crabs])
-    print(min([fsum1(x) for x in range(crabs[0][0], crabs[-1][0])]))
+def parse_input(specifier=None):
+    # crabs[p] is the number of crabs at position p
+    crabs = np.zeros(0, dtype=np.int64)
+    for chunk in aoc.iter_chunks(7, specifier, dtype=np.int64, sep=','):
+        counts = np.bincount(chunk)
+        crabs = np.pad(crabs, (0, max(0, counts.size - crabs.size)))
+        crabs[:counts.size] += counts
+    return crabs
 
 
-def part2(line):
-    crabs = sorted([(pos, count) for pos, count in Counter(map(lambda s: int(s.strip()), line.split(','))).items()])
-    consumption = [0, ] * (crabs[-1][0] - crabs[0][0] + 1)
-    for i in range(1, len(consumption)):
-        consumption[i] = consumption[i - 1] + i
-    fsum2 = lambda x: sum([count * consumption[abs(pos - x)] for pos, count in crabs])
-    print(min([fsum2(x) for x in range(crabs[0][0], crabs[-1][0])]))
+def distances(crabs):
+    # Total distance of the crabs to every position, from the number (and the
+    # sum of positions) of the crabs on each side. Shared by both parts.
+    pos = np.arange(crabs.size)
+    nleft, sleft = np.cumsum(crabs), np.cumsum(crabs * pos)
+    nright, sright = nleft[-1] - nleft, sleft[-1] - sleft
+    return pos * nleft - sleft + sright - pos * nright
 
 
-if __name__ == '__main__':
-    # set loglevel and read input
-    aoc.logging_setup()
-    lines = aoc.input_lines(7)
+def part1(specifier=None):
+    crabs = parse_input(specifier)
+    return int(distances(crabs)[np.flatnonzero(crabs)[0]:].min())
+
 
-    # first part
-    part1(lines[0])
+def part2(specifier=None):
+    # moving by d costs d * (d + 1) / 2 = (d^2 + |d|) / 2, and the sum of the
+    # squared distances expands to sum(p^2) - 2 x sum(p) + x^2 n
+    crabs = parse_input(specifier)
+    pos = np.arange(crabs.size)
+    n, s1, s2 = crabs.sum(), (crabs * pos).sum(), (crabs * pos**2).sum()
+    fuel = (s2 - 2 * pos * s1 + pos**2 * n + distances(crabs)) // 2
+    return int(fuel[np.flatnonzero(crabs)[0]:].min())
 
-    # second part
-    part2(lines[0])
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3.10
 import logging
 from collections import Counter
+from functools import cache
 
 import aoc
 
@@ -23,9 +24,9 @@ def parse_input(specifier=None):
     return signals, output
 
 
-if __name__ == '__main__':
-    aoc.logging_setup()
-    signals, output = parse_input()
+@cache
+def decode(specifier=None):
+    signals, output = parse_input(specifier)
     output_digits = []
     output_numbers = []
     for sig, out in zip(signals, output):
@@ -76,10 +77,19 @@ if __name__ == '__main__':
         for d in out:
             output_digits.append(sigset_inv[d])
         output_numbers.append(sum([d * 10**i for i, d in enumerate(reversed(output_digits[-4:]))]))
+    return output_digits, output_numbers
+
 
-    # first part
+def part1(specifier=None):
+    output_digits, _ = decode(specifier)
     output_digits_counts = Counter(output_digits)
-    print(sum([output_digits_counts[d] for d in [1, 4, 7, 8]]))
+    return sum([output_digits_counts[d] for d in [1, 4, 7, 8]])
+
 
-    # second part
-    print(sum(output_numbers))
+def part2(specifier=None):
+    _, output_numbers = decode(specifier)
+    return sum(output_numbers)
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
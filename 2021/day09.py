@@ -4,19 +4,20 @@ import logging
 from functools import reduce
 
 import numpy as np
-from termcolor import colored
 
 import aoc
 
+termcolor = aoc.lazy_import('termcolor')
+
 
 def datafmt(data, marked=[], highlighted=[]):
     cdata = data.astype(str)
     for coords in highlighted:
-        cdata[coords] = colored(cdata[coords], 'yellow', attrs=['bold'])
+        cdata[coords] = termcolor.colored(cdata[coords], 'yellow', attrs=['bold'])
     for coords in marked:
         if coords in highlighted:
             continue
-        cdata[coords] = colored(cdata[coords], 'red')
+        cdata[coords] = termcolor.colored(cdata[coords], 'red')
     return '\n'.join([''.join(row) for row in cdata])
 
 
@@ -31,24 +32,37 @@ def neighbours(i, j, data=None):
             continue
 
 
-if __name__ == '__main__':
-    aoc.logging_setup()
-    data = np.genfromtxt(
-        aoc.input_file(9),
-        dtype=int, delimiter=1,  # delimiter = 1 -> fields of width 1
-    )
+def parse_input(specifier=None):
+    return aoc.input_array(9, specifier, dtype=int, delimiter=1)  # delimiter = 1 -> fields of width 1
+
 
-    # first part
+def cached_input(specifier=None):
+    # the parsing is done by aoc.input_array(), so its source is part of the cache version too
+    version = aoc.code_version(parse_input) + aoc.code_version(aoc.input_array)
+    return aoc.cached_parse(9, specifier, parse_input, version=version)
+
+
+def find_low_points(data):
     low_points = []
     for i, j in np.ndindex(data.shape):
         neighbours_a = np.array(list(neighbours(i, j, data)))
         lowest = np.ndarray.min(data[tuple([*neighbours_a.T])])
         if data[i, j] < lowest:
             low_points.append((i, j))
-    logging.debug(f'\n{datafmt(data, [], low_points)}')
-    print(reduce(lambda a, b: a + data[b] + 1, low_points, 0))
+    return low_points
+
 
-    # second part
+def part1(specifier=None):
+    data = cached_input(specifier)
+    low_points = find_low_points(data)
+    if aoc.debug_enabled():
+        logging.debug(f'\n{datafmt(data, [], low_points)}')
+    return reduce(lambda a, b: a + data[b] + 1, low_points, 0)
+
+
+def part2(specifier=None):
+    data = cached_input(specifier)
+    low_points = find_low_points(data)
     basins = []
     for start in low_points:
         explored = {start}
@@ -58,12 +72,16 @@ if __name__ == '__main__':
             if here in explored:
                 continue
             explored.add(here)
-            v = data[here]
             for n in neighbours(*here, data):
                 if data[n] < 9 and n not in explored:
                     to_explore.append(n)
         basins.append(explored)
 
     basins.sort(key=lambda s: len(s))
-    logging.debug(f'\n{datafmt(data, reduce(set.union, basins), low_points)}')
-    print(reduce(lambda a, b: a * len(b), basins[-3:], 1))
+    if aoc.debug_enabled():
+        logging.debug(f'\n{datafmt(data, reduce(set.union, basins), low_points)}')
+    return reduce(lambda a, b: a * len(b), basins[-3:], 1)
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
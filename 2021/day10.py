@@ -2,37 +2,41 @@
 
 import logging
 from collections import namedtuple
-from functools import reduce
-
-from termcolor import colored
+from functools import cache, reduce
 
 import aoc
 
+termcolor = aoc.lazy_import('termcolor')
+
 
 def linefmt(line, invalid=[]):
     return ''.join([
-        c if i not in invalid else colored(c, 'red') for i, c in enumerate(line)])
+        c if i not in invalid else termcolor.colored(c, 'red') for i, c in enumerate(bytes(line).decode())])
 
 
-if __name__ == '__main__':
-    aoc.logging_setup()
+# the lines are parsed as bytes, straight from the mapped input
+pairs = {ord(o): ord(c) for o, c in {'(': ')', '{': '}', '[': ']', '<': '>'}.items()}
+pairs_inv = {v: k for k, v in pairs.items()}
+chars = set(pairs.keys()) | set(pairs_inv.keys())
+whitespace = set(b' \t\r')
+invalid_scores = {ord(c): score for c, score in {')': 3, ']': 57, '}': 1197, '>': 25137}.items()}
+incomplete_scores = {ord(c): score for c, score in {')': 1, ']': 2, '}': 3, '>': 4}.items()}
 
-    pairs = {'(': ')', '{': '}', '[': ']', '<': '>'}
-    pairs_inv = {v: k for k, v in pairs.items()}
-    chars = set(pairs.keys()) | set(pairs_inv.keys())
-    invalid_scores = {')': 3, ']': 57, '}': 1197, '>': 25137}
-    incomplete_scores = {')': 1, ']': 2, '}': 3, '>': 4}
+IncompleteLine = namedtuple('IncompleteLine', ['line', 'pending'])
 
-    # first part
-    IncompleteLine = namedtuple('IncompleteLine', ['line', 'pending'])
+
+@cache
+def check_syntax(specifier=None):
     valid = []
     syntax_error_score = []
-    for n, ln in enumerate(aoc.input(10), 1):
+    for n, ln in enumerate(aoc.input_buffer_lines(10, specifier), 1):
         pending_chunks = []
         invalid = []
         for i, c in enumerate(ln):
-            if c not in chars:
-                logging.error(f"Invalid character '{c}' in line {n}.")
+            if c in whitespace:
+                continue
+            elif c not in chars:
+                logging.error(f"Invalid character '{chr(c)}' in line {n}.")
             elif c in pairs:
                 pending_chunks.append(c)
             elif pending_chunks[-1] == pairs_inv[c]:
@@ -43,13 +47,23 @@ if __name__ == '__main__':
                 invalid.append(i)
         if not invalid:
             valid.append(IncompleteLine(ln, pending_chunks))
-        logging.debug(linefmt(ln, invalid))
+        if aoc.debug_enabled():
+            logging.debug(linefmt(ln, invalid))
+    return syntax_error_score, valid
+
 
-    # first part
-    print(sum(syntax_error_score))
+def part1(specifier=None):
+    syntax_error_score, _ = check_syntax(specifier)
+    return sum(syntax_error_score)
 
-    # second part
-    print(sorted(map(
+
+def part2(specifier=None):
+    _, valid = check_syntax(specifier)
+    return sorted(map(
         lambda t: reduce(lambda score, c: score * 5 + incomplete_scores[pairs[c]], reversed(t.pending), 0),
         valid
-    ))[len(valid) // 2])
+    ))[len(valid) // 2]
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
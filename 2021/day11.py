@@ -2,19 +2,21 @@
 
 import logging
 from collections import namedtuple
+from functools import cache
 from itertools import chain
 
 import numpy as np
-from termcolor import colored
 
 import aoc
 
+termcolor = aoc.lazy_import('termcolor')
+
 Neighbours = namedtuple('Neighbours', ('n', 'ne', 'e', 'se', 's', 'sw', 'w', 'nw'))
 
 
 def datafmt(data):
     cdata = data.astype(str)
-    cdata[data == 0] = colored('0', 'white', attrs=['bold'])
+    cdata[data == 0] = termcolor.colored('0', 'white', attrs=['bold'])
     return '\n'.join([''.join(row) for row in cdata])
 
 
@@ -31,12 +33,19 @@ def neighbours(i, j, data=None):
     ))
 
 
-if __name__ == '__main__':
-    aoc.logging_setup()
-    data = np.genfromtxt(
-        aoc.input_file(11),
-        dtype=int, delimiter=1,  # delimiter = 1 -> fields of width 1
-    )
+def parse_input(specifier=None):
+    return aoc.input_array(11, specifier, dtype=int, delimiter=1)  # delimiter = 1 -> fields of width 1
+
+
+def cached_input(specifier=None):
+    # the parsing is done by aoc.input_array(), so its source is part of the cache version too
+    version = aoc.code_version(parse_input) + aoc.code_version(aoc.input_array)
+    return aoc.cached_parse(11, specifier, parse_input, version=version)
+
+
+@cache
+def simulate(specifier=None):
+    data = cached_input(specifier)
     if not ((data >= 0).all() and (data < 9).all()):
         logging.error("Invalid input energy levels.")
         raise RuntimeError("Invalid input energy levels.")
@@ -72,11 +81,21 @@ if __name__ == '__main__':
         if iter_flash_all == -1 and nflashed_step == data.size:
             iter_flash_all = niter
         data[flashed] = 0
-        logging.debug(f'\n{datafmt(data)}\n')
+        if aoc.debug_enabled():
+            logging.debug(f'\n{datafmt(data)}\n')
         niter += 1
+    return nflashes_100, iter_flash_all
 
-    # first part
-    print(nflashes_100)
 
-    # second part
-    print(iter_flash_all)
+def part1(specifier=None):
+    nflashes_100, _ = simulate(specifier)
+    return nflashes_100
+
+
+def part2(specifier=None):
+    _, iter_flash_all = simulate(specifier)
+    return iter_flash_all
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
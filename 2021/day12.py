@@ -5,10 +5,10 @@ from collections import Counter, defaultdict
 from copy import deepcopy
 from functools import reduce
 
-from termcolor import colored
-
 import aoc
 
+termcolor = aoc.lazy_import('termcolor')
+
 
 class Cave:
     def __init__(self, s):
@@ -81,21 +81,21 @@ class Path:
         self.caves = {c: cavecls(c) for c in cave_names}
 
     def pathstr(self):
-        return colored('-', 'white', attrs=['bold']).join([colored(p, 'blue') for p in self.walked])
+        return termcolor.colored('-', 'white', attrs=['bold']).join([termcolor.colored(p, 'blue') for p in self.walked])
 
     def contstr(self):
         format_cont_set = lambda cont_set: ' '.join([f'{str(self.caves[c]):^7}' for c in cont_set])
         return '\n  '.join([
             f'{start:>5}: {format_cont_set(cont_set)}' if start != self.tail
-            else colored(f'{start:>5}: {format_cont_set(cont_set)}', 'red')
+            else termcolor.colored(f'{start:>5}: {format_cont_set(cont_set)}', 'red')
             for start, cont_set in self.continuations.items()
         ])
 
     def __str__(self):
         if self.is_done():
-            contstr = colored('DONE', 'green', attrs=['bold'])
+            contstr = termcolor.colored('DONE', 'green', attrs=['bold'])
         elif self.is_deadend():
-            contstr = colored('DEADEND', 'red', attrs=['bold']) + "\n  " + self.contstr()
+            contstr = termcolor.colored('DEADEND', 'red', attrs=['bold']) + "\n  " + self.contstr()
         else:
             contstr = self.contstr()
         return f'{self.pathstr()}\n  {contstr}\n'
@@ -157,23 +157,27 @@ def explore(continuations, cavecls):
     return allpaths
 
 
-if __name__ == '__main__':
-    aoc.logging_setup()
-
-    # Read input.
+def parse_input(specifier=None):
     continuations = defaultdict(set)
-    for n, seg in aoc.input_enum(12):
+    for n, seg in aoc.input_enum(12, specifier):
         a, b = seg.split('-', 1)
         if Cave.is_invalid(a) or Cave.is_invalid(b):
             logging.error(f'Skipping invalid path segment {seg} on input line {n}.')
             continue
         continuations[a].add(b)
         continuations[b].add(a)
+    return continuations
+
 
-    # first part
-    allpaths = explore(continuations, Cave)
-    print(sum(map(lambda p: p.is_done(), allpaths)))
+def part1(specifier=None):
+    allpaths = explore(parse_input(specifier), Cave)
+    return sum(map(lambda p: p.is_done(), allpaths))
 
-    # second part
-    allpaths = explore(continuations, Cave2)
-    print(sum(map(lambda p: p.is_done(), allpaths)))
+
+def part2(specifier=None):
+    allpaths = explore(parse_input(specifier), Cave2)
+    return sum(map(lambda p: p.is_done(), allpaths))
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)
@@ -1,18 +1,19 @@
 #!/usr/bin/env python3.10
 
 import logging
+from functools import cache
 from itertools import repeat, takewhile
 
 import numpy as np
 
 import aoc
 
-if __name__ == '__main__':
-    aoc.logging_setup()
-    inputf = aoc.input(13)
+# Convert bool array to string using unicode blocks.
+data2str = lambda data: '\n'.join([''.join(['█' if c else '·' for c in row]) for row in data])
+
 
-    # Convert bool array to string using unicode blocks.
-    data2str = lambda data: '\n'.join([''.join(['█' if c else '·' for c in row]) for row in data])
+def parse_input(specifier=None):
+    inputf = aoc.input(13, specifier)
 
     # Inverse x, y to produce same output as aoc example. Normalize dimensions to be odd.
     coords = list(map(lambda l: tuple(map(int, l.split(',')))[::-1], takewhile(lambda l: l != '', inputf)))
@@ -29,27 +30,37 @@ if __name__ == '__main__':
             map(lambda s: s.removeprefix('fold along').split('='),
                 takewhile(lambda l: l.startswith('fold along'), inputf)))
     )
-    logging.debug(f'initial\n{data2str(data)}\nfolds: {folds}')
+    return data, folds
+
+
+@cache
+def fold(specifier=None):
+    data, folds = aoc.cached_parse(13, specifier, parse_input)
+    if aoc.debug_enabled():
+        logging.debug(f'initial\n{data2str(data)}\nfolds: {folds}')
 
     # Process folds.
-    dots0 = 0
-    for i, (axis, n) in enumerate(folds):
+    for axis, n in folds:
         if axis == 'y':
             data = data[:n, :].copy() | np.flipud(data[n + 1:, :])
-            logging.debug(f'fold along {axis} on {n}\n{data2str(data)}')
+            if aoc.debug_enabled():
+                logging.debug(f'fold along {axis} on {n}\n{data2str(data)}')
         elif axis == 'x':
             data = data[:, :n].copy() | np.fliplr(data[:, n + 1:])
-            logging.debug(f'fold along {axis} on {n}\n{data2str(data)}')
+            if aoc.debug_enabled():
+                logging.debug(f'fold along {axis} on {n}\n{data2str(data)}')
         else:
             raise ValueError("Invalid fold axis: {axis}")
+    return data
 
-        if i == 0:
-            dots0 = np.sum(data)
 
-    print(aoc.hr())
+def part1(specifier=None):
+    return np.sum(fold(specifier))
 
-    # first part
-    print(np.sum(data))
 
-    # second part
-    print(data2str(data))
+def part2(specifier=None):
+    return data2str(fold(specifier))
+
+
+if __name__ == '__main__':
+    aoc.run(part1, part2)